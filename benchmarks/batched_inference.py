@@ -0,0 +1,75 @@
+# batched_inference.py
+# Compares decode throughput of the sequential path (one 30 s window after
+# another) with faster-whisper's batched pipeline, for long recordings.
+#
+# The batched pipeline cuts the clip at pauses found by voice activity
+# detection, so use real speech recordings: synthetic clips may be dropped
+# as non-speech and make the batched path look unrealistically fast.
+#
+# Usage (from the repository root):
+#   python benchmarks/batched_inference.py --wav long_dictation.wav
+#   python benchmarks/batched_inference.py --model base.en --batch-sizes 4 8 16 --wav a.wav b.wav
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from clips import SAMPLERATE, load_fixtures
+from openspeak.transcriber import WhisperTranscriber
+
+def time_decode(transcriber, clip, runs):
+    """Median wall-clock time to fully transcribe clip, and the text of the last run."""
+    timings = []
+    text = ''
+    for _ in range(runs):
+        start = time.perf_counter()
+        text = transcriber.transcribe_audio(clip)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), text
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OpenSpeak batched vs. sequential decoding benchmark")
+    parser.add_argument('--model', default='tiny.en')
+    parser.add_argument('--device', default='cpu')
+    parser.add_argument('--compute-type', default=None, help="default: int8 on CPU, float16 on GPU")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[8])
+    parser.add_argument('--wav', nargs='*', help="16 kHz WAV fixtures (default: synthetic clips)")
+    parser.add_argument('--seconds', type=float, nargs='+', default=[60, 180, 600],
+                        help="synthetic clip lengths when no WAV fixtures are given")
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    transcriber = WhisperTranscriber()
+    transcriber.warmup_enabled = True
+    transcriber.set_config(args.model, args.device, args.compute_type)
+    transcriber.initialize_model()
+    if transcriber.model is None:
+        raise SystemExit(f"Model '{args.model}' could not be loaded. Download it via the Settings window first.")
+
+    if not args.wav:
+        print("No --wav fixtures given; using synthetic clips. Results are only indicative.")
+    fixtures = load_fixtures(args.wav, args.seconds)
+    header = (f"{'fixture':<20} {'audio s':>8} {'mode':<12} {'decode s':>9} "
+              f"{'x realtime':>10} {'speedup':>8} {'words':>6}")
+    print(header)
+    print('-' * len(header))
+    for name, clip in fixtures:
+        duration = clip.size / SAMPLERATE
+        transcriber.batch_threshold_seconds = 0.0
+        sequential, text = time_decode(transcriber, clip, args.runs)
+        print(f"{name[:20]:<20} {duration:>8.1f} {'sequential':<12} {sequential:>9.3f} "
+              f"{duration / sequential:>10.1f} {1.0:>8.2f} {len(text.split()):>6}")
+        for batch_size in args.batch_sizes:
+            # Any clip length takes the batched path
+            transcriber.batch_threshold_seconds = 1e-9
+            transcriber.batch_size = batch_size
+            batched, text = time_decode(transcriber, clip, args.runs)
+            if not transcriber.batch_threshold_seconds:
+                raise SystemExit("This faster-whisper version has no BatchedInferencePipeline.")
+            print(f"{'':<20} {'':>8} {f'batch {batch_size}':<12} {batched:>9.3f} "
+                  f"{duration / batched:>10.1f} {sequential / batched:>8.2f} {len(text.split()):>6}")
@@ -0,0 +1,25 @@
+# clips.py
+# Audio fixtures shared by the benchmarks and the tests that reuse them:
+# 16 kHz recordings loaded from disk, or a synthetic speech-like signal.
+# Import after adding src/ to sys.path.
+
+import os
+
+# The same signal autotune times candidates on
+from openspeak.autotune import reference_clip as speech_like_clip
+
+SAMPLERATE = 16000
+
+def load_wav(path, samplerate=SAMPLERATE):
+    """Reads a WAV or FLAC recording as a mono float32 clip. Exits if it isn't sampled at samplerate."""
+    import soundfile as sf
+    audio, rate = sf.read(path, dtype='float32', always_2d=True)
+    if rate != samplerate:
+        raise SystemExit(f"{path} must be sampled at {samplerate} Hz (got {rate} Hz)")
+    return audio.mean(axis=1)
+
+def load_fixtures(wav_paths, lengths):
+    """Returns (name, clip) pairs from recordings, or speech-like synthetic clips of the given lengths."""
+    if wav_paths:
+        return [(os.path.basename(path), load_wav(path)) for path in wav_paths]
+    return [(f"synthetic {seconds:g}s", speech_like_clip(seconds)) for seconds in lengths]
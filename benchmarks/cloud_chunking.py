@@ -0,0 +1,65 @@
+# cloud_chunking.py
+# Measures the wall-clock speedup of splitting long recordings into
+# concurrent cloud requests, and checks that chunk results are stitched back
+# in order. Runs against a local stand-in for the OpenAI endpoint whose
+# latency grows with clip length, like the real service.
+#
+# Usage (from the repository root):
+#   python benchmarks/cloud_chunking.py [--segments 12] [--parallel 1 2 4 8]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_openai_server import FakeOpenAIServer
+from openspeak.cloud_transcriber import CloudTranscriber
+
+SAMPLERATE = 16000
+
+def tone_clip(n_segments, segment_seconds=8.0, gap_seconds=1.0):
+    """One tone per 'sentence', separated by short pauses. Tone n is 200 + 50*n Hz."""
+    parts = []
+    for n in range(n_segments):
+        t = np.arange(int(segment_seconds * SAMPLERATE)) / SAMPLERATE
+        parts.append(0.3 * np.sin(2 * np.pi * (200 + 50 * n) * t))
+        parts.append(np.zeros(int(gap_seconds * SAMPLERATE)))
+    return np.concatenate(parts).astype(np.float32)
+
+def dominant_tone(audio, samplerate):
+    """Stand-in 'transcription': the label of the loudest tone in the chunk."""
+    spectrum = np.abs(np.fft.rfft(audio))
+    frequency = np.fft.rfftfreq(audio.size, 1 / samplerate)[np.argmax(spectrum)]
+    return f"t{int(round(frequency / 50.0) * 50)}"
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OpenSpeak cloud chunking benchmark")
+    parser.add_argument('--segments', type=int, default=12, help="9-second segments in the clip")
+    parser.add_argument('--parallel', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--latency', type=float, default=0.05, help="stand-in seconds per audio second")
+    args = parser.parse_args()
+
+    clip = tone_clip(args.segments)
+    expected = " ".join(f"t{200 + 50 * n}" for n in range(args.segments))
+
+    server = FakeOpenAIServer(base_latency=0.1, seconds_per_audio_second=args.latency, transcribe=dominant_tone)
+    with server:
+        print(f"Clip: {clip.size / SAMPLERATE:.0f}s, stand-in latency 0.1s + {args.latency}s per audio second")
+        print(f"{'parallel':>8} {'requests':>9} {'wall s':>8} {'speedup':>8} {'in order':>9}")
+        baseline = None
+        for parallel in args.parallel:
+            transcriber = CloudTranscriber('test-key', base_url=server.base_url,
+                                           chunk_seconds=10.0, max_parallel_requests=parallel)
+            server.requests.clear()
+            start = time.perf_counter()
+            text = transcriber.transcribe_audio(clip)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            ordered = 'yes' if parallel == 1 or text == expected else 'NO'
+            print(f"{parallel:>8} {len(server.requests):>9} {elapsed:>8.2f} {baseline / elapsed:>8.2f} {ordered:>9}")
@@ -0,0 +1,75 @@
+# cloud_upload.py
+# Measures CloudTranscriber's request payload size, time to first byte of
+# the response (TTFB) and round-trip time for each upload encoding, against
+# a local stand-in for the OpenAI endpoint. --uplink-kbps simulates a slow
+# upload link, where payload size dominates TTFB.
+#
+# Usage (from the repository root):
+#   python benchmarks/cloud_upload.py [--seconds 5 15 60] [--runs 5] [--uplink-kbps 2000]
+
+import argparse
+import http.client
+import os
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from clips import speech_like_clip
+from fake_openai_server import FakeOpenAIServer
+from openspeak.cloud_transcriber import CloudTranscriber, encode_audio
+
+def time_to_first_byte(base_url, upload):
+    """
+    Posts an encoded (filename, bytes) upload the way the OpenAI client does
+    and returns the seconds until the first byte of the response arrives.
+    """
+    filename, data = upload
+    boundary = 'openspeak-benchmark'
+    body = (f'--{boundary}\r\nContent-Disposition: form-data; name="model"\r\n\r\nwhisper-1\r\n'
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n').encode() + data + f'\r\n--{boundary}--\r\n'.encode()
+    url = urlsplit(base_url)
+    connection = http.client.HTTPConnection(url.hostname, url.port)
+    try:
+        start = time.perf_counter()
+        connection.request('POST', url.path + '/audio/transcriptions', body,
+                           {'Content-Type': f'multipart/form-data; boundary={boundary}'})
+        response = connection.getresponse()  # Returns once the status line has arrived
+        ttfb = time.perf_counter() - start
+        response.read()
+        return ttfb
+    finally:
+        connection.close()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OpenSpeak cloud upload benchmark")
+    parser.add_argument('--seconds', type=float, nargs='+', default=[5, 15, 60])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--uplink-kbps', type=float, default=0, help="simulated upload speed (0 = unlimited)")
+    args = parser.parse_args()
+
+    uplink = args.uplink_kbps * 1000 / 8 or None
+    with FakeOpenAIServer(upload_bytes_per_second=uplink) as server:
+        print(f"{'clip s':>7} {'format':<7} {'upload KB':>10} {'vs wav':>7} {'TTFB ms':>8} {'median ms':>10}")
+        for seconds in args.seconds:
+            clip = speech_like_clip(seconds)
+            baseline = None
+            for upload_format in ('wav', 'wav16', 'flac'):
+                transcriber = CloudTranscriber('test-key', upload_format=upload_format, base_url=server.base_url)
+                server.requests.clear()
+                timings = []
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    transcriber.transcribe_audio(clip)
+                    timings.append(time.perf_counter() - start)
+                size = server.requests[-1][0]
+                baseline = baseline or size
+                upload = encode_audio(clip, upload_format=upload_format)
+                ttfb = statistics.median(time_to_first_byte(server.base_url, upload) for _ in range(args.runs))
+                print(f"{seconds:>7.0f} {upload_format:<7} {size / 1024:>10.1f} {size / baseline:>7.2f} "
+                      f"{ttfb * 1000:>8.1f} {statistics.median(timings) * 1000:>10.1f}")
@@ -0,0 +1,106 @@
+# decoding_profiles.py
+# Reports decode latency and word error rate (WER) per decoding profile
+# ([Local] decoding_profile) on a set of speech fixtures.
+#
+# Fixtures are pairs of files in one directory: a 16 kHz FLAC or WAV
+# recording and a .txt file with the same name holding its reference
+# transcript, e.g.
+#   benchmarks/fixtures/jfk_inaugural.flac
+#   benchmarks/fixtures/jfk_inaugural.txt
+# A few public-domain clips are shipped in benchmarks/fixtures (see the
+# README there); add typical dictations of your own the same way.
+#
+# Usage (from the repository root):
+#   python benchmarks/decoding_profiles.py [--fixtures benchmarks/fixtures] [--model tiny.en] [--runs 3]
+
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from clips import SAMPLERATE, load_wav
+from openspeak.transcriber import WhisperTranscriber, DECODING_PROFILES
+
+def load_fixtures(directory):
+    """Returns (name, clip, reference text) for every FLAC/WAV file with a matching .txt transcript."""
+    fixtures = []
+    audio_paths = glob.glob(os.path.join(directory, '*.flac')) + glob.glob(os.path.join(directory, '*.wav'))
+    for audio_path in sorted(audio_paths):
+        txt_path = os.path.splitext(audio_path)[0] + '.txt'
+        if not os.path.exists(txt_path):
+            print(f"Skipping {audio_path}: no reference transcript {txt_path}")
+            continue
+        with open(txt_path, encoding='utf-8') as txt_file:
+            reference = txt_file.read()
+        fixtures.append((os.path.basename(audio_path), load_wav(audio_path), reference))
+    return fixtures
+
+def normalize(text):
+    """Lower-cases and drops punctuation so WER counts only word differences."""
+    return re.sub(r"[^\w\s']", ' ', text.lower()).split()
+
+def word_errors(reference, hypothesis):
+    """Word-level edit distance (substitutions + insertions + deletions)."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ref_word != hyp_word)))
+        previous = current
+    return previous[-1]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OpenSpeak decoding profile benchmark")
+    parser.add_argument('--fixtures', default=os.path.join(REPO_ROOT, 'benchmarks', 'fixtures'),
+                        help="directory of 16 kHz .flac/.wav recordings with .txt reference transcripts")
+    parser.add_argument('--model', default='tiny.en')
+    parser.add_argument('--device', default='cpu')
+    parser.add_argument('--compute-type', default=None, help="default: int8 on CPU, float16 on GPU")
+    parser.add_argument('--profiles', nargs='+', default=list(DECODING_PROFILES), choices=list(DECODING_PROFILES))
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        raise SystemExit(f"No fixtures found in {args.fixtures}. Add .flac/.wav recordings with matching .txt transcripts.")
+
+    transcriber = WhisperTranscriber()
+    transcriber.warmup_enabled = True
+    transcriber.batch_threshold_seconds = 0.0  # Compare profiles on the sequential path
+    transcriber.set_config(args.model, args.device, args.compute_type)
+    transcriber.initialize_model()
+    if transcriber.model is None:
+        raise SystemExit(f"Model '{args.model}' could not be loaded. Download it via the Settings window first.")
+
+    audio_seconds = sum(clip.size for _, clip, _ in fixtures) / SAMPLERATE
+    print(f"Model: {args.model}, {len(fixtures)} fixtures, {audio_seconds:.1f}s of audio")
+    header = f"{'profile':<10} {'median s':>9} {'total s':>8} {'RTF':>6} {'WER %':>6}"
+    print(header)
+    print('-' * len(header))
+    for profile in args.profiles:
+        transcriber.set_decoding_profile(profile)
+        latencies = []
+        total = 0.0
+        errors = 0
+        words = 0
+        for name, clip, reference in fixtures:
+            timings = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                text = transcriber.transcribe_audio(clip)
+                timings.append(time.perf_counter() - start)
+            latency = statistics.median(timings)
+            latencies.append(latency)
+            total += latency
+            reference_words = normalize(reference)
+            errors += word_errors(reference_words, normalize(text))
+            words += len(reference_words)
+        print(f"{profile:<10} {statistics.median(latencies):>9.3f} {total:>8.3f} "
+              f"{total / audio_seconds:>6.3f} {100 * errors / max(words, 1):>6.1f}")
@@ -0,0 +1,106 @@
+# fake_openai_server.py
+# A local stand-in for the OpenAI audio transcription endpoint, used by the
+# benchmarks to measure upload size and latency without network access.
+
+import io
+import json
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import soundfile as sf
+
+class FakeOpenAIServer:
+    """
+    Serves POST /v1/audio/transcriptions on localhost.
+
+    Each request sleeps for base_latency + seconds_per_audio_second * clip
+    duration to imitate server-side decoding, then answers with
+    transcribe(audio, samplerate) (or a fixed string). If
+    upload_bytes_per_second is set, receiving the request body also takes as
+    long as it would over an uplink of that speed.
+    """
+
+    def __init__(self, base_latency=0.0, seconds_per_audio_second=0.0, transcribe=None,
+                 upload_bytes_per_second=None):
+        self.base_latency = base_latency
+        self.seconds_per_audio_second = seconds_per_audio_second
+        self.transcribe = transcribe
+        self.upload_bytes_per_second = upload_bytes_per_second
+        self.requests = []  # (upload bytes, audio seconds) per request
+        self.max_concurrent = 0
+        self._active = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _handle(self, content_type, body):
+        message = BytesParser(policy=HTTP).parsebytes(
+            b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+        )
+        upload = None
+        for part in message.iter_parts():
+            if part.get_param('name', header='content-disposition') == 'file':
+                upload = part.get_payload(decode=True)
+        if upload is None:
+            return 400, {"error": {"message": "missing file"}}
+
+        audio, samplerate = sf.read(io.BytesIO(upload), dtype='float32')
+        duration = len(audio) / samplerate
+        with self._lock:
+            self.requests.append((len(upload), duration))
+            self._active += 1
+            self.max_concurrent = max(self.max_concurrent, self._active)
+        try:
+            time.sleep(self.base_latency + self.seconds_per_audio_second * duration)
+            text = self.transcribe(audio, samplerate) if self.transcribe else "stand-in transcription"
+        finally:
+            with self._lock:
+                self._active -= 1
+        return 200, {"text": text}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if server.upload_bytes_per_second:
+                    time.sleep(len(body) / server.upload_bytes_per_second)
+                if self.path.rstrip('/').endswith('/audio/transcriptions'):
+                    status, payload = server._handle(self.headers.get('Content-Type', ''), body)
+                else:
+                    status, payload = 404, {"error": {"message": "not found"}}
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output clean
+
+        return Handler
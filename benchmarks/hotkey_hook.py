@@ -0,0 +1,65 @@
+# hotkey_hook.py
+# Measures the per-event cost of HotkeyManager's global keyboard hook by
+# feeding it synthetic key events, as if the user were typing very fast.
+#
+# Usage (from the repository root):
+#   python benchmarks/hotkey_hook.py [--events 200000] [--hotkey ctrl+space]
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from types import SimpleNamespace
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+import keyboard
+from openspeak.hotkey_manager import HotkeyManager
+
+def typing_events(n_events, hotkey_every=0):
+    """Down/up pairs for random letters, with the hotkey pressed every hotkey_every keystrokes."""
+    rng = random.Random(0)
+    events = []
+    for i in range(n_events // 2):
+        if hotkey_every and i % hotkey_every == 0:
+            events += [
+                SimpleNamespace(name='ctrl', scan_code=29, event_type=keyboard.KEY_DOWN),
+                SimpleNamespace(name='space', scan_code=57, event_type=keyboard.KEY_DOWN),
+                SimpleNamespace(name='space', scan_code=57, event_type=keyboard.KEY_UP),
+                SimpleNamespace(name='ctrl', scan_code=29, event_type=keyboard.KEY_UP),
+            ]
+            continue
+        letter = rng.choice(string.ascii_lowercase)
+        scan_code = 16 + string.ascii_lowercase.index(letter)
+        events.append(SimpleNamespace(name=letter, scan_code=scan_code, event_type=keyboard.KEY_DOWN))
+        events.append(SimpleNamespace(name=letter, scan_code=scan_code, event_type=keyboard.KEY_UP))
+    return events
+
+def measure(manager, events, repeats=5):
+    handler = manager._key_event_handler
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for event in events:
+            handler(event)
+        best = min(best, time.perf_counter() - start)
+    return best / len(events)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OpenSpeak hotkey hook benchmark")
+    parser.add_argument('--events', type=int, default=200000)
+    parser.add_argument('--hotkey', default='ctrl+space')
+    args = parser.parse_args()
+
+    presses = []
+    for mode in ('hold', 'toggle'):
+        manager = HotkeyManager(lambda: presses.append(1), lambda: None)
+        manager.set_config(args.hotkey, mode)
+        for label, hotkey_every in (('typing only', 0), ('hotkey every 50 keys', 50)):
+            per_event = measure(manager, typing_events(args.events, hotkey_every))
+            print(f"{mode:<7} {label:<22} {per_event * 1e9:>8.0f} ns/event "
+                  f"({1 / per_event / 1e6:.1f}M events/s)")
+    print(f"Hotkey callbacks fired: {len(presses)}")
@@ -0,0 +1,219 @@
+# pipeline_latency.py
+# End-to-end latency benchmark: drives OpenSpeakApp's real hotkey-release
+# path from audio fixtures and reports per-stage timings and the real-time
+# factor (RTF = decode time / audio duration) per model size and compute type.
+#
+# The microphone, indicator, keyboard hook and text injection are replaced
+# with headless stand-ins, so this runs on a CPU-only Linux box without a
+# display. Use --models fake to run without faster-whisper installed.
+#
+# Usage (from the repository root):
+#   python benchmarks/pipeline_latency.py --models tiny.en base.en --compute-types int8 float32
+#   python benchmarks/pipeline_latency.py --wav fixtures/*.wav
+#   python benchmarks/pipeline_latency.py --models fake
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+import openspeak.app as app_module
+from clips import SAMPLERATE, load_fixtures
+from openspeak.audio_recorder import AudioRecorder
+from openspeak.hotkey_manager import HotkeyManager
+from openspeak.text_injector import FakeInjector
+
+# ---------------- Headless stand-ins ----------------
+class _NullStream:
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+class ReplayRecorder(AudioRecorder):
+    """Feeds a clip through the real capture callback instead of a microphone."""
+
+    block_frames = 512
+
+    def _open_stream(self):
+        return _NullStream()
+
+    def play(self, clip):
+        for start in range(0, clip.size, self.block_frames):
+            block = clip[start:start + self.block_frames].reshape(-1, 1)
+            self._callback(block, block.shape[0], None, None)
+
+class HeadlessIndicator:
+    def __init__(self):
+        self.states = []
+
+    def update_state(self, state):
+        self.states.append(state)
+
+class NullHotkeyManager(HotkeyManager):
+    """Parses hotkey config like the real manager but never hooks the keyboard."""
+
+    def start_listening(self):
+        pass
+
+    def stop_listening(self):
+        pass
+
+class FakeWhisperModel:
+    """Imitates WhisperModel.transcribe: one lazy segment per 30 s window, decoded at a fixed RTF."""
+
+    def __init__(self, rtf=0.1):
+        self.rtf = rtf
+
+    def transcribe(self, audio, **kwargs):
+        def segments():
+            for n, start in enumerate(range(0, audio.size, 30 * SAMPLERATE)):
+                window = audio[start:start + 30 * SAMPLERATE]
+                time.sleep(self.rtf * window.size / SAMPLERATE)
+                yield SimpleNamespace(text=f" Segment {n + 1}.")
+        return segments(), SimpleNamespace(language='en', language_probability=1.0)
+
+# ---------------- Stage timing ----------------
+class StageTimer:
+    """Wraps callables and accumulates the time spent inside them per stage."""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+
+    def reset(self):
+        self.totals.clear()
+
+    def wrap(self, name, func):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.totals[name] += time.perf_counter() - start
+        return timed
+
+    def wrap_generator(self, name, func):
+        """Times only the work done inside the generator, not the time its consumer spends."""
+        def timed(*args, **kwargs):
+            iterator = iter(func(*args, **kwargs))
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    self.totals[name] += time.perf_counter() - start
+                    return
+                self.totals[name] += time.perf_counter() - start
+                yield item
+        return timed
+
+# ---------------- Harness ----------------
+def build_app():
+    # Settings reads and writes config.ini in the working directory, so keep
+    # the benchmark away from the user's real config
+    os.chdir(tempfile.mkdtemp(prefix='openspeak-bench-'))
+    with open('config.ini', 'w') as config_file:
+        config_file.write("[General]\nengine_type = local\nfirst_run_complete = true\n"
+                          "injection_mode = type\n[Local]\nwarmup = true\n")
+
+    app_module.Indicator = HeadlessIndicator
+    app_module.HotkeyManager = NullHotkeyManager
+    app_module.AudioRecorder = ReplayRecorder
+    app = app_module.OpenSpeakApp()
+    while app.model_loading:
+        time.sleep(0.01)
+    app.injector = FakeInjector()
+    return app
+
+def load_model(app, model_size, compute_type, fake_rtf):
+    transcriber = app.local_transcriber
+    if model_size == 'fake':
+        app.local_dependencies_installed = True
+        transcriber.model = FakeWhisperModel(fake_rtf)
+        return True
+    transcriber.set_config(model_size, 'cpu', compute_type)
+    transcriber.model = None
+    if not transcriber.is_model_downloaded(model_size):
+        print(f"Model '{model_size}' is not downloaded; downloading...")
+        return transcriber.download_model(model_size)
+    transcriber.initialize_model()
+    return transcriber.model is not None
+
+def run_once(app, timer, clip):
+    """Records, releases the hotkey and waits until all text is injected. Returns timings in seconds."""
+    timer.reset()
+    app.injector.injected.clear()
+
+    app._handle_hotkey_press()
+    start = time.perf_counter()
+    app.audio_recorder.play(clip)
+    capture = time.perf_counter() - start
+
+    released = time.perf_counter()
+    app._handle_hotkey_release()
+    while app.pipeline.depth() > 0:
+        time.sleep(0.0005)
+
+    injected = app.injector.injected
+    return {
+        'capture': capture,
+        'buffer': timer.totals['buffer'],
+        'preprocess': timer.totals['preprocess'],
+        'decode': timer.totals['decode'],
+        'inject': timer.totals['inject'],
+        'first_text': injected[0][0] - released if injected else float('nan'),
+        'last_text': injected[-1][0] - released if injected else float('nan'),
+    }
+
+def instrument(app, timer):
+    app.audio_recorder.stop = timer.wrap('buffer', app.audio_recorder.stop)
+    app._preprocess_audio = timer.wrap('preprocess', app._preprocess_audio)
+    transcriber = app.local_transcriber
+    transcriber.iter_transcription = timer.wrap_generator('decode', transcriber.iter_transcription)
+    app.injector.send = timer.wrap('inject', app.injector.send)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OpenSpeak end-to-end latency benchmark")
+    parser.add_argument('--models', nargs='+', default=['tiny.en'], help="model sizes, or 'fake'")
+    parser.add_argument('--compute-types', nargs='+', default=['int8'])
+    parser.add_argument('--wav', nargs='*', help="16 kHz WAV fixtures (default: synthetic clips)")
+    parser.add_argument('--seconds', type=float, nargs='+', default=[5, 15, 30, 60],
+                        help="synthetic clip lengths when no WAV fixtures are given")
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--fake-rtf', type=float, default=0.1, help="decode speed of the fake model")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.wav, args.seconds)
+    app = build_app()
+    timer = StageTimer()
+    instrument(app, timer)
+
+    header = (f"{'model':<10} {'compute':<8} {'fixture':<18} {'audio s':>7} {'buffer ms':>9} {'prep ms':>8} "
+              f"{'decode s':>8} {'inject ms':>9} {'1st text s':>10} {'all text s':>10} {'RTF':>6}")
+    print(header)
+    print('-' * len(header))
+    for model_size in args.models:
+        for compute_type in (['-'] if model_size == 'fake' else args.compute_types):
+            if not load_model(app, model_size, compute_type, args.fake_rtf):
+                print(f"{model_size:<10} {compute_type:<8} could not be loaded, skipping")
+                continue
+            for name, clip in fixtures:
+                runs = [run_once(app, timer, clip) for _ in range(args.runs)]
+                median = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+                duration = clip.size / SAMPLERATE
+                print(f"{model_size:<10} {compute_type:<8} {name[:18]:<18} {duration:>7.1f} "
+                      f"{median['buffer'] * 1000:>9.2f} {median['preprocess'] * 1000:>8.2f} "
+                      f"{median['decode']:>8.3f} {median['inject'] * 1000:>9.2f} "
+                      f"{median['first_text']:>10.3f} {median['last_text']:>10.3f} "
+                      f"{median['decode'] / duration:>6.3f}")
@@ -0,0 +1,86 @@
+# startup.py
+# Measures OpenSpeak's cold-start cost: import time per module and the time
+# from constructing OpenSpeakApp until the hotkey listener is ready.
+#
+# Usage (from the repository root):
+#   python benchmarks/startup.py [--top 15] [--skip-app]
+
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC_DIR = os.path.join(REPO_ROOT, 'src')
+
+# Modules that should not be loaded before the hotkey is ready
+HEAVY_MODULES = ('torch', 'faster_whisper', 'ctranslate2', 'openai', 'customtkinter')
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, cwd=REPO_ROOT, env=env
+    )
+
+def parse_importtime(stderr):
+    """Returns (module, self_us, cumulative_us, depth) tuples from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+def report_imports(top):
+    result = run_python(
+        "import sys, openspeak.app\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    if result.returncode != 0:
+        print("Importing openspeak.app failed:")
+        print(result.stderr.strip().splitlines()[-1])
+        return
+
+    rows = parse_importtime(result.stderr)
+    total_us = sum(row[1] for row in rows)
+    print(f"Total import time for openspeak.app: {total_us / 1000:.1f} ms")
+    print(f"\nTop {top} modules by cumulative import time:")
+    print(f"{'module':<40} {'self ms':>10} {'cumul ms':>10}")
+    for name, self_us, cumulative_us, _ in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"{name:<40} {self_us / 1000:>10.1f} {cumulative_us / 1000:>10.1f}")
+
+    loaded = [m for m in result.stdout.strip().split(',') if m]
+    print(f"\nHeavy modules loaded at startup: {', '.join(loaded) if loaded else 'none'}")
+
+def report_hotkey_ready():
+    result = run_python(
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "from openspeak.app import OpenSpeakApp\n"
+        "app = OpenSpeakApp()\n"
+        "print(f'READY {time.perf_counter() - start:.3f} {app.startup_seconds:.3f}')\n"
+        "app.hotkey_manager.stop_listening()\n"
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith('READY '):
+            _, total, construct = line.split()
+            print(f"\nTime to hotkey ready: {float(total) * 1000:.0f} ms "
+                  f"(imports {(float(total) - float(construct)) * 1000:.0f} ms, "
+                  f"OpenSpeakApp() {float(construct) * 1000:.0f} ms)")
+            return
+    error = result.stderr.strip().splitlines()
+    print(f"\nCould not construct OpenSpeakApp (needs a display and keyboard hook access): "
+          f"{error[-1] if error else 'unknown error'}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OpenSpeak startup benchmark")
+    parser.add_argument('--top', type=int, default=15, help="number of modules to list")
+    parser.add_argument('--skip-app', action='store_true', help="only measure import cost")
+    args = parser.parse_args()
+
+    report_imports(args.top)
+    if not args.skip_app:
+        report_hotkey_ready()
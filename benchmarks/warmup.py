@@ -0,0 +1,80 @@
+# warmup.py
+# Compares first-call transcription latency against steady-state latency,
+# with and without WhisperTranscriber's warm-up pass. Each mode runs in a
+# fresh process so one-time setup costs are not shared between them.
+#
+# Usage (from the repository root):
+#   python benchmarks/warmup.py [--model tiny.en] [--device cpu] [--wav clip.wav] [--runs 5]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+def load_clip(wav_path, seconds=5.0):
+    """Loads a mono 16 kHz clip, or synthesizes one if no WAV file is given."""
+    from clips import load_wav, speech_like_clip
+    return load_wav(wav_path) if wav_path else speech_like_clip(seconds)
+
+def measure(args, warmup):
+    """Loads the model and times the first and subsequent transcriptions."""
+    from openspeak.transcriber import WhisperTranscriber
+
+    transcriber = WhisperTranscriber()
+    transcriber.warmup_enabled = warmup
+    transcriber.set_config(args.model, args.device)
+    start = time.perf_counter()
+    transcriber.initialize_model()
+    if transcriber.model is None:
+        raise SystemExit(f"Model '{args.model}' could not be loaded. Download it via the Settings window first.")
+    load_seconds = time.perf_counter() - start
+
+    clip = load_clip(args.wav)
+    timings = []
+    for _ in range(args.runs + 1):
+        start = time.perf_counter()
+        transcriber.transcribe_audio(clip)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        'load': load_seconds,
+        'warmup': transcriber.warmup_seconds,
+        'first': timings[0],
+        'steady': statistics.median(timings[1:]),
+    }
+
+def run_mode(warmup):
+    command = [sys.executable, __file__, '--child'] + (['--warmup'] if warmup else []) + sys.argv[1:]
+    result = subprocess.run(command, capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        if line.startswith('RESULT '):
+            return json.loads(line[len('RESULT '):])
+    raise SystemExit(result.stderr.strip() or result.stdout.strip())
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OpenSpeak warm-up benchmark")
+    parser.add_argument('--model', default='tiny.en')
+    parser.add_argument('--device', default='cpu')
+    parser.add_argument('--wav', help="16 kHz WAV file to transcribe (default: synthetic speech-like noise)")
+    parser.add_argument('--runs', type=int, default=5, help="steady-state runs after the first call")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--warmup', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print('RESULT ' + json.dumps(measure(args, args.warmup)))
+        sys.exit(0)
+
+    print(f"Model: {args.model}, device: {args.device}")
+    print(f"{'mode':<12} {'load s':>8} {'warm-up s':>10} {'first s':>8} {'steady s':>9} {'first/steady':>13}")
+    for warmup in (False, True):
+        r = run_mode(warmup)
+        warm = f"{r['warmup']:.3f}" if r['warmup'] is not None else '-'
+        print(f"{'warm-up' if warmup else 'cold':<12} {r['load']:>8.3f} {warm:>10} "
+              f"{r['first']:>8.3f} {r['steady']:>9.3f} {r['first'] / r['steady']:>13.2f}")
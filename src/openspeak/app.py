@@ -5,21 +5,24 @@
 import threading
 import sys
 import os
-from pystray import Icon, Menu, MenuItem
-from PIL import Image
+import time
 from queue import Queue
 
 from .audio_recorder import AudioRecorder
 from .hotkey_manager import HotkeyManager
-from .transcriber import WhisperTranscriber, are_dependencies_installed
-from .cloud_transcriber import CloudTranscriber
-from .text_injector import inject_text
+from .transcriber import WhisperTranscriber, DECODING_PROFILES, are_dependencies_installed, install_dependencies
+from .streaming import StreamingTranscriber
+from .pipeline import TranscriptionPipeline
+from .preprocessing import trim_silence
+from .text_injector import create_injector
 from .settings import Settings
-from .gui import ControlPanel
 from .indicator import Indicator
+from .metrics import metrics, MetricsHTTPServer, MetricsFileWriter
+from .tracing import tracer
 
 class OpenSpeakApp:
     def __init__(self):
+        start_time = time.perf_counter()
         self.settings = Settings()
         self.indicator = Indicator()
         self.download_queue = Queue()
@@ -30,102 +33,615 @@ class OpenSpeakApp:
         
         self.audio_recorder = AudioRecorder()
         self.hotkey_manager = HotkeyManager(self._handle_hotkey_press, self._handle_hotkey_release)
+        self.injector = create_injector()
         
-        self.control_panel = ControlPanel(
-            self.settings,
-            on_close_callback=self.on_settings_closed,
-            is_model_downloaded_callback=self.is_model_downloaded,
-            download_model_callback=self.start_model_download,
-            download_queue=self.download_queue,
-            are_local_dependencies_installed=self.are_local_dependencies_installed,
-            install_local_dependencies_callback=self.start_local_dependency_installation
-        )
-        self.control_panel.withdraw() # Start hidden
+        # The Settings window (and customtkinter) is only loaded on first open
+        self.control_panel = None
 
         self.icon = None
         self.is_recording = False
+        self.streaming_enabled = False
+        self.stream_chunk_seconds = 10.0
+        self.streamer = None
+        self.trim_silence_enabled = True
+        self.silence_threshold_db = -45.0
+
+        # Background model loading. Clips recorded while the model is still
+        # loading are held in pending_clips and transcribed once it is ready.
+        self.model_loading = False
+        self.pending_clips = []
+        self._model_lock = threading.Lock()
+        self._loader_running = False
+        self._reload_requested = False
+        self._autotune_running = False
+        # Grows with every recording, so background tuning can tell it overlapped one
+        self.recordings_started = 0
+
+        # Idle eviction: the local model is unloaded after idle_unload_seconds
+        # without use and reloaded as soon as the hotkey is pressed again, so
+        # the reload overlaps with the user speaking.
+        self.idle_unload_seconds = 0.0
+        self._last_activity = time.monotonic()
+        self._model_evicted = False
+        self._prefetching = False
+        self._prefetch_released_at = None
+        self._idle_monitor = None
+        self.prefetch_count = 0
+        self.prefetch_hidden_count = 0
+
+        # Clips are decoded by a fixed worker pool and injected in recording order
+        self.pipeline = TranscriptionPipeline(
+            self._inject_transcription,
+            on_idle=self._update_idle_state,
+            num_workers=self._get_number('General', 'transcription_workers', 1),
+            max_pending=self._get_number('General', 'transcription_queue_size', 8)
+        )
+
+        # Optional metrics exporters, configured in [Metrics]
+        self.metrics_server = None
+        self.metrics_writer = None
+        self.trace_path = 'openspeak-trace.json'
+
+        # Config values as of the last reload, keyed by (section, option)
+        self._applied_config = {}
         
         self.reload_config()
+        self.startup_seconds = time.perf_counter() - start_time
+        print(f"Hotkey ready after {self.startup_seconds:.2f}s.")
 
     def reload_config(self):
+        """
+        Re-reads config.ini and reconfigures only the subsystems whose options
+        changed since the last reload. Returns the names of those subsystems.
+        """
         print("Reloading configuration...")
-        self.settings.load()
-        
-        # Stop the listener before changing config
-        self.hotkey_manager.stop_listening()
+        start_time = time.perf_counter()
+        with self.settings.lock:
+            self.settings.load()
+            snapshot = self._config_snapshot()
+        changed_keys = {key for key in snapshot.keys() | self._applied_config.keys()
+                        if snapshot.get(key) != self._applied_config.get(key)}
+        components = set()
+        for section, option in changed_keys:
+            components.update(self._components_for(section, option))
+
+        # Dependencies can change without a config change, e.g. after installation
+        dependencies_installed = are_dependencies_installed()
+        if dependencies_installed != self.local_dependencies_installed:
+            self.local_dependencies_installed = dependencies_installed
+            components.add('local engine')
+
+        if 'hotkey' in components:
+            self._apply_hotkey_config()
+        if 'pipeline' in components:
+            self._apply_pipeline_config()
+        if 'local engine' in components:
+            self._apply_local_engine_config()
+        if 'cloud engine' in components:
+            self._apply_cloud_engine_config()
+        if 'metrics' in components:
+            self._apply_metrics_config()
+        if 'tracing' in components:
+            self._apply_tracing_config()
+
+        self._applied_config = snapshot
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        if components:
+            print(f"Configuration reloaded in {elapsed_ms:.1f} ms. Updated: {', '.join(sorted(components))}.")
+        else:
+            print(f"Configuration unchanged ({elapsed_ms:.1f} ms).")
+        return sorted(components)
+
+    def _config_snapshot(self):
+        config = self.settings.config
+        return {(section, option): value for section in config.sections() for option, value in config.items(section)}
 
-        # Check if local dependencies are installed
-        self.local_dependencies_installed = are_dependencies_installed()
+    def _components_for(self, section, option):
+        """Names the subsystems that depend on a config option."""
+        if section == 'General':
+            if option in ('hotkey', 'hotkey_mode'):
+                return ('hotkey',)
+            if option == 'engine_type':
+                return ('local engine', 'cloud engine')
+            if option == 'device':
+                return ('local engine',)
+            if option in ('first_run_complete', 'gpu_libraries_installed'):
+                return ()
+            if option == 'transcription_workers':
+                # Also the number of parallel transcriptions the local model allows
+                return ('pipeline', 'local engine')
+            return ('pipeline',)
+        if section == 'Local':
+            return ('local engine',)
+        if section == 'Autotune':
+            return ()  # Written by the app itself once tuning finishes
+        if section == 'OpenAI':
+            return ('cloud engine',)
+        if section == 'Metrics':
+            return ('metrics',)
+        if section == 'Tracing':
+            return ('tracing',)
+        return ()
 
-        # Hotkey config
+    def _apply_hotkey_config(self):
+        # Stop the listener before changing config, then restart it with the new one
+        self.hotkey_manager.stop_listening()
         mode = self.settings.get_general('hotkey_mode')
         hotkey = self.settings.get_general('hotkey')
         self.hotkey_manager.set_config(hotkey, mode)
-        
-        # Engine config
-        engine_type = self.settings.get_general('engine_type')
-        if engine_type == 'local':
-            if self.local_dependencies_installed:
-                model_size = self.settings.get_local('model_size')
-                device = self.settings.get_general('device')
-                self.local_transcriber.set_config(model_size, device)
-                # Proactively load the model after configuration is set
-                self.local_transcriber.initialize_model()
-            else:
-                print("Local dependencies not found. Please install them via the settings panel.")
-                # Ensure model is unloaded if dependencies were uninstalled
-                self.local_transcriber.set_config(None, None)
-
-        elif engine_type == 'openai': # openai
-            api_key = self.settings.get_openai('api_key')
-            if api_key:
-                try:
-                    self.cloud_transcriber = CloudTranscriber(api_key)
-                except ValueError as e:
-                    print(e)
-                    self.cloud_transcriber = None
-            else:
-                self.cloud_transcriber = None
-        
-        # Restart the listener with the new configuration
+        self.injector.keys_held = self.hotkey_manager.hotkey_held
         self.hotkey_manager.start_listening()
 
+    def _apply_pipeline_config(self):
+        # Streaming config
+        self.streaming_enabled = self.settings.get_general('streaming') == 'true'
+        self.stream_chunk_seconds = self._get_number('General', 'stream_chunk_seconds', 10.0)
+
+        # Transcription pipeline config
+        self.pipeline.set_workers(self._get_number('General', 'transcription_workers', 1))
+        self.pipeline.max_pending = self._get_number('General', 'transcription_queue_size', 8)
+
+        # Silence trimming config
+        self.trim_silence_enabled = self.settings.get_general('trim_silence') == 'true'
+        self.silence_threshold_db = self._get_number('General', 'silence_threshold_db', -45.0)
+
+        # Text injection config
+        self.injector = create_injector(
+            self.settings.get_general('injection_mode'),
+            paste_threshold=self._get_number('General', 'paste_threshold', 100)
+        )
+        self.injector.keys_held = self.hotkey_manager.hotkey_held
+
+    def _apply_local_engine_config(self):
+        if self.settings.get_general('engine_type') != 'local':
+            return
+        if self.local_dependencies_installed:
+            model_size = self.settings.get_local('model_size')
+            device = self.settings.get_general('device')
+            self.local_transcriber.warmup_enabled = self.settings.get_local('warmup') == 'true'
+            self.local_transcriber.batch_threshold_seconds = self._get_number('Local', 'batch_threshold_seconds', 60.0)
+            self.local_transcriber.batch_size = self._get_number('Local', 'batch_size', 8)
+            self.local_transcriber.set_decoding_profile(self.settings.get_local('decoding_profile'))
+            self._apply_model_pool_config(device)
+            self.idle_unload_seconds = self._get_number('Local', 'idle_unload_minutes', 0.0) * 60
+            if self.idle_unload_seconds:
+                self._start_idle_monitor()
+            self._model_evicted = False
+            compute_type, cpu_threads = self._model_tuning(model_size, device)
+            self.local_transcriber.set_config(
+                model_size, device, compute_type, cpu_threads,
+                num_workers=self._get_number('General', 'transcription_workers', 1)
+            )
+            # Proactively load the model in the background so the app is usable right away
+            self._start_model_load()
+        else:
+            print("Local dependencies not found. Please install them via the settings panel.")
+            # Ensure model is unloaded if dependencies were uninstalled
+            self.local_transcriber.set_config(None, None)
+
+    def _apply_model_pool_config(self, device):
+        capacity = self._get_number('Local', 'model_pool_size', 2)
+        budget = self.settings.get_local('model_pool_memory_mb')
+        if budget != 'auto':
+            budget = self._get_number('Local', 'model_pool_memory_mb', 0)
+        # An 'auto' budget is worked out by the pool on the loader thread
+        self.local_transcriber.model_pool.configure(capacity, max_memory_mb=budget, device=device)
+
+    def _model_tuning(self, model_size, device):
+        """
+        Returns the (compute_type, cpu_threads) to load the model with: manual
+        overrides from [Local] win, then the autotuned values for this machine,
+        then the defaults (None, 0).
+        """
+        compute_type = self.settings.get_local('compute_type')
+        cpu_threads = self.settings.get_local('cpu_threads')
+        tuned = self._tuned_settings(model_size, device)
+        if compute_type == 'auto':
+            compute_type = tuned[0] if tuned else None
+        if cpu_threads == 'auto':
+            cpu_threads = tuned[1] if tuned else 0
+        try:
+            cpu_threads = int(cpu_threads)
+        except (TypeError, ValueError):
+            cpu_threads = 0
+        return compute_type, cpu_threads
+
+    def _tuned_settings(self, model_size, device):
+        """Looks up autotune results for this model and device, if they were measured on this machine."""
+        from .autotune import machine_id
+        if self.settings.get('Autotune', 'machine') != machine_id():
+            return None
+        value = self.settings.get('Autotune', f"{model_size}.{device}")
+        try:
+            compute_type, cpu_threads = value.split(',')
+            return compute_type.strip(), int(cpu_threads)
+        except (AttributeError, ValueError):
+            return None
+
+    def _has_tuning(self, model_size, device):
+        """True if tuning already ran for this model and device on this machine, even if it failed."""
+        from .autotune import machine_id
+        return (self.settings.get('Autotune', 'machine') == machine_id()
+                and self.settings.get('Autotune', f"{model_size}.{device}") is not None)
+
+    def _refresh_tuning(self):
+        """Before a load, picks up tuning results that arrived since the model was configured."""
+        transcriber = self.local_transcriber
+        if transcriber.model is None and transcriber.model_size and transcriber.device:
+            compute_type, cpu_threads = self._model_tuning(transcriber.model_size, transcriber.device)
+            transcriber.set_config(transcriber.model_size, transcriber.device, compute_type, cpu_threads,
+                                   transcriber.num_workers)
+
+    def _start_autotune(self):
+        """
+        Tunes the loaded model on a background thread, once per machine, model
+        and device, if any tuned setting is left on 'auto'. The model keeps
+        serving dictations meanwhile; the result is used from the next load.
+        """
+        transcriber = self.local_transcriber
+        model_size, device = transcriber.model_size, transcriber.device
+        if self.settings.get_local('autotune') != 'true' or transcriber.model is None:
+            return
+        if 'auto' not in (self.settings.get_local('compute_type'), self.settings.get_local('cpu_threads')):
+            return
+        if self._has_tuning(model_size, device):
+            return
+        with self._model_lock:
+            if self._autotune_running:
+                return
+            self._autotune_running = True
+        threading.Thread(target=self._autotune_task,
+                         args=(model_size, device, transcriber.decoding_profile), daemon=True).start()
+
+    def _autotune_task(self, model_size, device, decoding_profile):
+        from .autotune import autotune, TuningInterrupted
+        print(f"Tuning '{model_size}' on {device} for this machine in the background. "
+              "The result is used from the next model load.")
+        try:
+            best, _ = autotune(model_size, device, self.local_transcriber.cache_path,
+                               decode_options=DECODING_PROFILES[decoding_profile],
+                               wait_until_idle=self._wait_until_idle,
+                               activity_count=lambda: self.recordings_started)
+        except TuningInterrupted as e:
+            # Nothing is recorded, so tuning runs again after the next load
+            print(f"Autotune stopped: {e}. It will run again after the next model load.")
+            return
+        except Exception as e:
+            print(f"Autotune failed: {e}")
+            best = None
+        finally:
+            with self._model_lock:
+                self._autotune_running = False
+        self._save_tuning(model_size, device, best)
+
+    def _wait_until_idle(self):
+        """Blocks while a clip is being recorded or decoded, so tuning doesn't slow dictation down."""
+        while self.is_recording or self.pipeline.depth() > 0:
+            time.sleep(0.5)
+
+    def _save_tuning(self, model_size, device, best):
+        """Records a tuning result. A failed run is recorded too, so it isn't retried on every load."""
+        from .autotune import machine_id
+        # batch() holds the settings lock, so reload_config and the GUI see either all of it or none
+        with self.settings.batch():
+            if self.settings.get('Autotune', 'machine') != machine_id():
+                # Results from other hardware don't apply here
+                self.settings.clear_section('Autotune')
+                self.settings.set('Autotune', 'machine', machine_id())
+            self.settings.set('Autotune', f"{model_size}.{device}", f"{best[0]},{best[1]}" if best else 'failed')
+        if best:
+            print(f"Autotune picked compute type '{best[0]}' with {best[1] or 'default'} CPU threads.")
+        else:
+            print("Autotune could not time any configuration. Keeping the default settings.")
+
+    def _apply_cloud_engine_config(self):
+        if self.settings.get_general('engine_type') != 'openai':
+            return
+        api_key = self.settings.get_openai('api_key')
+        if api_key:
+            # Imported here so the openai client is only loaded when it is used
+            from .cloud_transcriber import CloudTranscriber
+            try:
+                self.cloud_transcriber = CloudTranscriber(
+                    api_key,
+                    upload_format=self.settings.get_openai('upload_format'),
+                    chunk_seconds=self._get_number('OpenAI', 'chunk_seconds', 20.0),
+                    max_parallel_requests=self._get_number('OpenAI', 'max_parallel_requests', 4),
+                    request_timeout=self._get_number('OpenAI', 'request_timeout', 15.0),
+                    max_retries=self._get_number('OpenAI', 'max_retries', 2)
+                )
+            except ValueError as e:
+                print(e)
+                self.cloud_transcriber = None
+        else:
+            self.cloud_transcriber = None
+
+    def _apply_metrics_config(self):
+        self._stop_metrics_exporters()
+        port = self._get_number('Metrics', 'http_port', 0)
+        if port:
+            try:
+                self.metrics_server = MetricsHTTPServer(metrics, port)
+                self.metrics_server.start()
+            except OSError as e:
+                print(f"Could not start metrics server on port {port}: {e}")
+                self.metrics_server = None
+        path = self.settings.get('Metrics', 'file')
+        if path:
+            self.metrics_writer = MetricsFileWriter(
+                metrics, path, interval=self._get_number('Metrics', 'interval_seconds', 60.0))
+            self.metrics_writer.start()
+
+    def _apply_tracing_config(self):
+        self.trace_path = self.settings.get('Tracing', 'file') or 'openspeak-trace.json'
+        if self.settings.get('Tracing', 'enabled') == 'true':
+            tracer.enable()
+        else:
+            tracer.disable()
+
+    def _toggle_tracing(self):
+        if tracer.enabled:
+            tracer.disable()
+        else:
+            tracer.enable()
+
+    def _save_trace(self):
+        try:
+            tracer.dump(self.trace_path)
+        except OSError as e:
+            print(f"Failed to write trace: {e}")
+
+    def _stop_metrics_exporters(self):
+        if self.metrics_server:
+            self.metrics_server.stop()
+            self.metrics_server = None
+        if self.metrics_writer:
+            self.metrics_writer.stop()
+            self.metrics_writer = None
+
+    def _get_number(self, section, option, default):
+        """Reads a numeric setting, converted to the type of default."""
+        try:
+            return type(default)(self.settings.get(section, option))
+        except (TypeError, ValueError):
+            return default
+
     def on_settings_closed(self):
         self.reload_config()
 
+    def _start_model_load(self):
+        """Loads the configured local model on a background thread."""
+        with self._model_lock:
+            self.model_loading = True
+            if self._loader_running:
+                # The running loader picks up the new configuration when it finishes
+                self._reload_requested = True
+                return
+            self._loader_running = True
+        threading.Thread(target=self._model_load_task, daemon=True).start()
+
+    def _model_load_task(self):
+        while True:
+            self._refresh_tuning()
+            self.local_transcriber.initialize_model()
+            with self._model_lock:
+                if self._reload_requested:
+                    self._reload_requested = False
+                    continue
+                self._loader_running = False
+                self.model_loading = False
+                if self._prefetch_released_at is not None:
+                    # How long the user waited for a reload that outlasted their speech
+                    metrics.observe('model_prefetch_wait_seconds', time.perf_counter() - self._prefetch_released_at)
+                    self._prefetch_released_at = None
+                pending, self.pending_clips = self.pending_clips, []
+                # Submitted under the lock so newer clips cannot overtake them
+                for audio_data in pending:
+                    self._submit_clip(audio_data)
+            break
+
+        if pending:
+            self.indicator.update_state("thinking")
+        self._start_autotune()
+
+    def _start_idle_monitor(self):
+        if self._idle_monitor is None:
+            self._idle_monitor = threading.Thread(target=self._idle_monitor_task, daemon=True)
+            self._idle_monitor.start()
+
+    def _idle_monitor_task(self):
+        while True:
+            # Check a few times per timeout so the model is freed soon after it expires
+            time.sleep(min(30.0, max(self.idle_unload_seconds, 4.0) / 4))
+            if self.idle_unload_seconds:
+                self._evict_idle_model()
+
+    def _evict_idle_model(self):
+        """Unloads the local model if it has not been used for idle_unload_seconds. Returns True if it was."""
+        with self._model_lock:
+            idle_seconds = time.monotonic() - self._last_activity
+            if (idle_seconds < self.idle_unload_seconds or self.is_recording or self.model_loading
+                    or self.pipeline.depth() > 0 or self.local_transcriber.model is None):
+                return False
+            self.local_transcriber.unload_model()
+            self._model_evicted = True
+        print(f"Model unloaded after {idle_seconds / 60:.1f} idle minutes. It will reload on the next hotkey press.")
+        metrics.increment('model_evictions_total')
+        return True
+
+    def _prefetch_model(self):
+        """Starts reloading an evicted model. Returns True if a reload was started."""
+        with self._model_lock:
+            if not self._model_evicted or self.settings.get_general('engine_type') != 'local':
+                return False
+            self._model_evicted = False
+        print("Reloading the local model while you speak...")
+        metrics.increment('model_prefetches_total')
+        self._start_model_load()
+        return True
+
+    def _record_prefetch_outcome(self):
+        """Called on hotkey release after a prefetch: was the reload done before the user finished speaking?"""
+        with self._model_lock:
+            hidden = not self.model_loading
+            if not hidden:
+                self._prefetch_released_at = time.perf_counter()
+        self.prefetch_count += 1
+        if hidden:
+            self.prefetch_hidden_count += 1
+            metrics.increment('model_prefetch_hidden_total')
+        else:
+            metrics.increment('model_prefetch_exposed_total')
+        print(f"Model reload {'was' if hidden else 'was not'} hidden behind speech "
+              f"({self.prefetch_hidden_count}/{self.prefetch_count} reloads hidden so far).")
+
+    def _queue_if_model_loading(self, audio_data):
+        """Holds the clip until the local model has loaded. Returns True if it was queued."""
+        if self.settings.get_general('engine_type') != 'local':
+            return False
+        with self._model_lock:
+            if not self.model_loading:
+                return False
+            self.pending_clips.append(audio_data)
+        print("Model is still loading. Clip queued until it is ready.")
+        self.indicator.update_state("warming_up")
+        return True
+
+    @tracer.traced('hotkey press')
     def _handle_hotkey_press(self):
         if not self.is_recording:
             self.is_recording = True
+            self.recordings_started += 1
+            self._last_activity = time.monotonic()
+            self._prefetching = self._prefetch_model()
             self.indicator.update_state("listening")
-            self.audio_recorder.start()
+            self.streamer = None
+            # stream_chunk_seconds = 0 turns streaming off, like other 0-valued options
+            if (self.streaming_enabled and self.stream_chunk_seconds > 0
+                    and self._active_transcriber() and not self.model_loading):
+                self.streamer = StreamingTranscriber(
+                    self._transcribe_clip,
+                    samplerate=self.audio_recorder.samplerate,
+                    chunk_seconds=self.stream_chunk_seconds,
+                    preprocess=self._preprocess_audio if self.trim_silence_enabled else None
+                )
+                self.streamer.start()
+                self.audio_recorder.start(on_block=self.streamer.feed)
+            else:
+                self.audio_recorder.start()
 
+    @tracer.traced('hotkey release')
     def _handle_hotkey_release(self):
         if self.is_recording:
             self.is_recording = False
             self.indicator.update_state("thinking")
             audio_data = self.audio_recorder.stop()
+            metrics.increment('recordings_total')
+            metrics.observe('recording_duration_seconds', audio_data.size / self.audio_recorder.samplerate)
+            if self._prefetching:
+                self._prefetching = False
+                self._record_prefetch_outcome()
+
+            if self.streamer:
+                # Most of the clip has already been decoded; only the tail is left.
+                streamer = self.streamer
+                if not self.pipeline.submit(lambda: self._with_leading_space(streamer.finish())):
+                    # The clip is dropped like any other when the queue is full
+                    streamer.cancel()
+                    self._update_idle_state()
+                self.streamer = None
+                return
+
+            if audio_data.size > 0 and self.trim_silence_enabled:
+                audio_data = self._preprocess_audio(audio_data)
+                if audio_data.size == 0:
+                    print("No speech detected. Skipping transcription.")
+                    metrics.increment('silent_clips_skipped_total')
+                    self._update_idle_state()
+                    return
 
             if audio_data.size > 0:
-                threading.Thread(target=self._transcribe_and_inject, args=(audio_data,)).start()
+                if self._queue_if_model_loading(audio_data):
+                    return
+                if not self._submit_clip(audio_data):
+                    self._update_idle_state()
             else:
                 print("No audio recorded.")
-                self.indicator.update_state("idle")
+                self._update_idle_state()
+
+    def _submit_clip(self, audio_data):
+        return self.pipeline.submit(lambda: self._transcription_job(audio_data))
+
+    def _update_idle_state(self):
+        """Hides the indicator once nothing is being recorded or decoded."""
+        self._last_activity = time.monotonic()
+        if self.is_recording:
+            return
+        if self.pipeline.depth() > 0:
+            self.indicator.update_state("thinking")
+        elif not self.pending_clips:
+            self.indicator.update_state("idle")
+
+    @tracer.traced('trim silence')
+    def _preprocess_audio(self, audio_data):
+        """Trims silence around the speech in a clip. Returns an empty array for silent clips."""
+        return trim_silence(
+            audio_data,
+            samplerate=self.audio_recorder.samplerate,
+            threshold_db=self.silence_threshold_db
+        )
 
-    def _transcribe_and_inject(self, audio_data):
+    def _active_transcriber(self):
+        """Returns the transcriber for the configured engine, or None if it is not usable."""
         engine_type = self.settings.get_general('engine_type')
-        transcribed_text = ""
-        
         if engine_type == 'local' and self.local_transcriber and self.local_dependencies_installed:
-            transcribed_text = self.local_transcriber.transcribe_audio(audio_data)
+            return self.local_transcriber
         elif engine_type == 'openai' and self.cloud_transcriber:
-            transcribed_text = self.cloud_transcriber.transcribe_audio(audio_data)
-        else:
-            print(f"Cannot transcribe. Engine '{engine_type}' is not properly configured.")
+            return self.cloud_transcriber
+        return None
+
+    def _transcription_job(self, audio_data):
+        """Runs on a pipeline worker. Yields text to inject as it is decoded."""
+        transcriber = self._active_transcriber()
+        if transcriber is self.local_transcriber and transcriber is not None:
+            # Inject each segment as soon as faster-whisper yields it
+            for text in transcriber.iter_transcription(audio_data):
+                yield " " + text
+            return
+        text = self._transcribe_clip(audio_data)
+        if text:
+            yield " " + text
+
+    def _with_leading_space(self, text):
+        return " " + text if text else ""
+
+    def _transcribe_clip(self, audio_data):
+        """Returns the text for the clip from the configured engine."""
+        transcriber = self._active_transcriber()
+        if transcriber is self.cloud_transcriber and transcriber is not None:
+            from .cloud_transcriber import CloudTranscriptionError
+            try:
+                return transcriber.transcribe_audio(audio_data)
+            except CloudTranscriptionError as e:
+                metrics.increment('cloud_fallbacks_total')
+                return self._fall_back_to_local(audio_data, e)
+        if transcriber:
+            return transcriber.transcribe_audio(audio_data)
+        engine_type = self.settings.get_general('engine_type')
+        print(f"Cannot transcribe. Engine '{engine_type}' is not properly configured.")
+        return ""
+
+    def _fall_back_to_local(self, audio_data, error):
+        """Transcribes with the local model when the cloud engine fails, if one is loaded."""
+        if self.local_transcriber.model is not None:
+            print(f"Cloud transcription failed ({error}). Falling back to the local model.")
+            return self.local_transcriber.transcribe_audio(audio_data)
+        # Nothing to fall back to; don't type the error into the user's document
+        print(f"Cloud transcription failed ({error}) and no local model is loaded.")
+        return ""
 
-        if transcribed_text:
-            inject_text(" " + transcribed_text)
-            
-        self.indicator.update_state("idle")
+    def _inject_transcription(self, transcribed_text):
+        self.injector.inject(transcribed_text)
 
     def is_model_downloaded(self, model_size):
         return self.local_transcriber.is_model_downloaded(model_size)
@@ -146,7 +662,7 @@ class OpenSpeakApp:
     def start_local_dependency_installation(self, progress_callback):
         """Starts a background thread to install torch and faster-whisper."""
         def install_task():
-            success = self.local_transcriber.install_dependencies(progress_callback)
+            success = install_dependencies(progress_callback)
             # After installation, reload the config to initialize the transcriber
             if success:
                 self.reload_config()
@@ -159,14 +675,31 @@ class OpenSpeakApp:
         # This is called from the pystray thread, so we need to schedule
         # the tkinter operations to run in the main thread.
         def safe_open():
+            if self.control_panel is None:
+                self.control_panel = self._create_control_panel()
             self.control_panel.deiconify()
             self.control_panel.lift()
             self.control_panel.focus_force()
         self.indicator.root.after(0, safe_open)
 
+    def _create_control_panel(self):
+        from .gui import ControlPanel
+        return ControlPanel(
+            self.settings,
+            on_close_callback=self.on_settings_closed,
+            is_model_downloaded_callback=self.is_model_downloaded,
+            download_model_callback=self.start_model_download,
+            download_queue=self.download_queue,
+            are_local_dependencies_installed=self.are_local_dependencies_installed,
+            install_local_dependencies_callback=self.start_local_dependency_installation
+        )
+
     def _quit_action(self):
         print("Quitting application...")
         self.hotkey_manager.stop_listening()
+        self._stop_metrics_exporters()
+        if tracer.enabled:
+            self._save_trace()
         self.icon.stop()
         # Schedule the indicator's destroy method to be called from the main thread
         if self.indicator:
@@ -174,8 +707,14 @@ class OpenSpeakApp:
 
     def run(self):
         # The listener is now started by reload_config() called in __init__
+        # The tray libraries are only needed here, which keeps the app importable headless
+        from pystray import Icon, Menu, MenuItem
+        from PIL import Image
+
         menu = Menu(
             MenuItem('Settings', self._open_settings),
+            MenuItem('Record Trace', self._toggle_tracing, checked=lambda item: tracer.enabled),
+            MenuItem('Save Trace', self._save_trace, enabled=lambda item: tracer.enabled),
             MenuItem('Quit', self._quit_action)
         )
         
@@ -0,0 +1,51 @@
+# atomic_file.py
+# This module replaces files atomically, so a reader or a crash never leaves
+# a half-written config, metrics or trace file behind.
+
+import contextlib
+import os
+import stat
+import tempfile
+
+# The process umask, read once so new files get the usual permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+@contextlib.contextmanager
+def atomic_write(path, mode='w'):
+    """
+    Yields a temporary file in the same directory as path. When the block
+    exits normally, the data is flushed to disk and the file renamed over
+    path, keeping path's permissions; on error it is removed and path is
+    left untouched.
+    """
+    path = os.path.abspath(path)
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}-", suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as tmp_file:
+            yield tmp_file
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        try:
+            permissions = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            permissions = 0o666 & ~_UMASK  # mkstemp creates files readable by the owner only
+        os.chmod(tmp_path, permissions)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    _fsync_directory(directory)
+
+def _fsync_directory(directory):
+    """Makes the rename itself durable. Not possible (or needed) on Windows."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    with contextlib.suppress(OSError):
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -1,52 +1,96 @@
 # audio_recorder.py
-# This module will handle recording audio from the microphone. 
+# This module will handle recording audio from the microphone.
 
-import sounddevice as sd
 import numpy as np
-import queue
+
+from .tracing import tracer
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # PortAudio missing, e.g. on a headless benchmark box
+    sd = None
 
 class AudioRecorder:
-    def __init__(self, samplerate=16000, channels=1):
+    def __init__(self, samplerate=16000, channels=1, initial_seconds=30):
         self.samplerate = samplerate
         self.channels = channels
         self.stream = None
-        self.q = queue.Queue()
+        self.on_block = None
+
+        # Capture buffer the audio callback writes into directly. It is
+        # reallocated per recording so clips handed out by stop() stay valid.
+        self._initial_frames = int(initial_seconds * samplerate)
+        self._buffer = np.empty((0, channels), dtype=np.float32)
+        self._frames = 0
+
+        # Stream status counters, updated from the audio callback
+        self.overflows = 0
+        self.underflows = 0
+
+    def _grow(self, min_frames):
+        """Doubles the capture buffer until it can hold min_frames."""
+        capacity = max(self._buffer.shape[0], self._initial_frames, 1)
+        while capacity < min_frames:
+            capacity *= 2
+        new_buffer = np.empty((capacity, self.channels), dtype=np.float32)
+        new_buffer[:self._frames] = self._buffer[:self._frames]
+        self._buffer = new_buffer
 
     def _callback(self, indata, frames, time, status):
         """This is called (from a separate thread) for each audio block."""
         if status:
-            print(status, flush=True)
-        self.q.put(indata.copy())
+            if status.input_overflow:
+                self.overflows += 1
+            if status.input_underflow:
+                self.underflows += 1
+        start = self._frames
+        end = start + frames
+        if end > self._buffer.shape[0]:
+            self._grow(end)
+        self._buffer[start:end] = indata
+        self._frames = end
+        if self.on_block:
+            self.on_block(self._buffer[start:end])
 
-    def start(self):
+    def start(self, on_block=None):
+        """Starts recording. If on_block is given, every recorded block is also
+        passed to it as it arrives (used for streaming transcription)."""
         if self.stream is not None:
             return  # Already recording
 
-        self.q = queue.Queue()
-        self.stream = sd.InputStream(
+        # Size the new buffer after the longest recent clip to avoid regrowing
+        capacity = max(self._initial_frames, self._frames)
+        self._buffer = np.empty((capacity, self.channels), dtype=np.float32)
+        self._frames = 0
+        self.overflows = 0
+        self.underflows = 0
+        self.on_block = on_block
+        self.stream = self._open_stream()
+        self.stream.start()
+        print("Recording started...")
+
+    def _open_stream(self):
+        if sd is None:
+            raise RuntimeError("sounddevice/PortAudio is not available; cannot record audio.")
+        return sd.InputStream(
             samplerate=self.samplerate,
             channels=self.channels,
             callback=self._callback,
             dtype='float32'  # faster-whisper expects float32
         )
-        self.stream.start()
-        print("Recording started...")
 
+    @tracer.traced('AudioRecorder.stop')
     def stop(self):
+        """Stops recording and returns the clip as a view into the capture buffer."""
         if self.stream is None:
-            return np.array([]) # Not recording
+            return np.array([], dtype=np.float32) # Not recording
 
         self.stream.stop()
         self.stream.close()
         self.stream = None
+        self.on_block = None
         print("Recording stopped.")
+        if self.overflows or self.underflows:
+            print(f"Audio stream reported {self.overflows} overflow(s) and {self.underflows} underflow(s).")
 
-        # Drain the queue and concatenate
-        audio_blocks = []
-        while not self.q.empty():
-            audio_blocks.append(self.q.get())
-        
-        if not audio_blocks:
-            return np.array([], dtype=np.float32)
-
-        return np.concatenate(audio_blocks, axis=0).flatten() 
\ No newline at end of file
+        return self._buffer[:self._frames].reshape(-1)
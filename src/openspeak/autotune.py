@@ -0,0 +1,124 @@
+# autotune.py
+# This module finds the fastest compute type and CPU thread count for a
+# local model on this machine by timing each combination on a reference clip.
+
+import os
+import platform
+import time
+
+import numpy as np
+
+# How often a candidate is re-timed after dictation overlapped its timing
+MAX_TIMING_ATTEMPTS = 3
+
+class TuningInterrupted(Exception):
+    """Raised when a candidate could not be timed without dictation running alongside."""
+
+# Compute types worth trying per device, fastest-on-average first
+COMPUTE_TYPE_CANDIDATES = {
+    'cpu': ('int8', 'int8_float32', 'float32'),
+    'cuda': ('float16', 'int8_float16'),
+}
+
+def machine_id():
+    """Identifies the hardware tuning results were measured on."""
+    return f"{platform.machine()} {platform.processor() or 'cpu'} x{os.cpu_count()}"
+
+def thread_candidates(device):
+    """CPU thread counts to try. 0 lets CTranslate2 pick its default."""
+    if device != 'cpu':
+        return (0,)
+    cores = os.cpu_count() or 1
+    return tuple(sorted({max(1, cores // 4), max(1, cores // 2), cores}))
+
+def reference_clip(seconds=5.0, samplerate=16000):
+    """A speech-like clip (amplitude-modulated noise) so the encoder does a full pass."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * samplerate)) / samplerate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t))
+    return (0.2 * envelope * rng.standard_normal(t.size)).astype(np.float32)
+
+def time_transcription(model, clip, runs=2, decode_options=None, interrupted=None):
+    """
+    Returns the fastest of several full transcriptions, after one untimed
+    warm-up run. interrupted() is checked after every run; once it is true
+    the timing is no longer trustworthy and None is returned.
+    """
+    best = None
+    for run in range(runs + 1):
+        start = time.perf_counter()
+        segments, _ = model.transcribe(clip, **(decode_options or {}))
+        for _ in segments:  # Segments are decoded lazily
+            pass
+        elapsed = time.perf_counter() - start
+        if interrupted and interrupted():
+            return None
+        if run and (best is None or elapsed < best):
+            best = elapsed
+    return best
+
+def _time_undisturbed(model, clip, runs, decode_options, wait_until_idle, activity_count):
+    """Times a candidate, starting over when other work overlapped the timing. None if it always did."""
+    for _ in range(MAX_TIMING_ATTEMPTS):
+        if wait_until_idle:
+            wait_until_idle()
+        if activity_count is None:
+            return time_transcription(model, clip, runs, decode_options)
+        started = activity_count()
+        seconds = time_transcription(model, clip, runs, decode_options,
+                                     interrupted=lambda: activity_count() != started)
+        if seconds is not None:
+            return seconds
+        print("Autotune: dictation overlapped the timing. Discarding it and measuring again.")
+    return None
+
+def autotune(model_size, device, download_root, clip=None, runs=2, decode_options=None,
+             wait_until_idle=None, activity_count=None):
+    """
+    Loads the model with every candidate compute type and thread count and
+    times it on clip, decoding with decode_options. Returns (compute_type,
+    cpu_threads) of the fastest combination, or None if none could be loaded,
+    and a list of (compute_type, cpu_threads, seconds) results; seconds is
+    None on failure. If given, wait_until_idle is called before each
+    candidate is timed, so tuning can pause while the app is busy, and
+    activity_count() is a counter that grows whenever the app starts other
+    work; a timing during which it changed is discarded and repeated.
+    Raises TuningInterrupted if that keeps happening.
+    """
+    from faster_whisper import WhisperModel
+
+    clip = reference_clip() if clip is None else clip
+    results = []
+    for compute_type in COMPUTE_TYPE_CANDIDATES.get(device, COMPUTE_TYPE_CANDIDATES['cpu']):
+        for cpu_threads in thread_candidates(device):
+            if wait_until_idle:
+                wait_until_idle()
+            try:
+                model = WhisperModel(
+                    model_size,
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=cpu_threads,
+                    download_root=download_root,
+                    local_files_only=True
+                )
+                seconds = _time_undisturbed(model, clip, runs, decode_options, wait_until_idle, activity_count)
+                del model
+                if seconds is None:
+                    raise TuningInterrupted(f"{compute_type} with {cpu_threads or 'default'} threads "
+                                            "could not be timed without dictation running alongside")
+            except TuningInterrupted:
+                raise
+            except Exception as e:
+                # Not every compute type is supported on every CPU/GPU
+                print(f"Autotune: {compute_type} with {cpu_threads or 'default'} threads failed: {e}")
+                seconds = None
+            else:
+                print(f"Autotune: {compute_type} with {cpu_threads or 'default'} threads took {seconds:.3f}s.")
+            results.append((compute_type, cpu_threads, seconds))
+
+    timed = [r for r in results if r[2] is not None]
+    if not timed:
+        return None, results
+    compute_type, cpu_threads, _ = min(timed, key=lambda r: r[2])
+    return (compute_type, cpu_threads), results
@@ -1,37 +1,168 @@
+import openai
 from openai import OpenAI
-import tempfile
-import os
+from concurrent.futures import ThreadPoolExecutor
+import io
+import random
+import threading
+import time
 import soundfile as sf
 
+from .metrics import metrics
+from .tracing import tracer
+from .preprocessing import split_at_silence
+
+# Upload encodings: name -> (file extension, soundfile format, soundfile subtype)
+UPLOAD_FORMATS = {
+    'flac': ('flac', 'FLAC', 'PCM_16'),
+    'wav16': ('wav', 'WAV', 'PCM_16'),
+    'wav': ('wav', 'WAV', 'FLOAT'),
+}
+
+def encode_audio(audio_data, samplerate=16000, upload_format='flac'):
+    """Encodes a float32 clip in memory. Returns a (filename, bytes) tuple for upload."""
+    extension, file_format, subtype = UPLOAD_FORMATS.get(upload_format, UPLOAD_FORMATS['flac'])
+    buffer = io.BytesIO()
+    sf.write(buffer, audio_data, samplerate, format=file_format, subtype=subtype)
+    return f"audio.{extension}", buffer.getvalue()
+
+# Errors worth retrying: the same request may succeed a moment later
+TRANSIENT_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+class CloudTranscriptionError(Exception):
+    """Raised when the cloud engine cannot produce a transcription."""
+
+class CircuitBreaker:
+    """
+    Stops calling a failing service for a while. After failure_threshold
+    consecutive failures the circuit opens; once reset_seconds have passed a
+    single trial call is let through, which closes it again on success.
+    """
+
+    def __init__(self, failure_threshold=3, reset_seconds=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_seconds:
+                # Half-open: let one trial request through
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def is_open(self):
+        with self._lock:
+            return self.opened_at is not None
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    print(f"Cloud engine failed {self.failures} times in a row. Pausing requests for {self.reset_seconds:.0f}s.")
+                self.opened_at = time.monotonic()
+
 class CloudTranscriber:
-    def __init__(self, api_key):
+    def __init__(self, api_key, upload_format='flac', base_url=None, chunk_seconds=20.0, max_parallel_requests=4,
+                 request_timeout=15.0, max_retries=2, retry_backoff=0.5, circuit_breaker=None):
         if not api_key:
             raise ValueError("API key is missing.")
-        self.client = OpenAI(api_key=api_key)
+        if upload_format not in UPLOAD_FORMATS:
+            print(f"Unknown upload format '{upload_format}'. Using 'flac'.")
+            upload_format = 'flac'
+        self.upload_format = upload_format
+        # Retries are handled here (with jitter), not by the client
+        self.client = OpenAI(api_key=api_key, base_url=base_url, timeout=request_timeout, max_retries=0)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+
+        # Long clips are split and sent as concurrent requests. chunk_seconds <= 0 disables this.
+        self.chunk_seconds = chunk_seconds
+        self.max_parallel_requests = max(1, max_parallel_requests)
+        self._executor = None
+
+    def _request(self, audio_data, samplerate):
+        # Encode in memory instead of going through a temporary file
+        with tracer.span('encode upload', format=self.upload_format):
+            upload = encode_audio(audio_data, samplerate, self.upload_format)
+        start = time.perf_counter()
+        try:
+            with tracer.span('cloud request', bytes=len(upload[1])):
+                transcription = self.client.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=upload
+                )
+        except Exception:
+            metrics.increment('cloud_request_errors_total')
+            raise
+        metrics.observe('cloud_request_seconds', time.perf_counter() - start)
+        metrics.observe('cloud_upload_bytes', len(upload[1]))
+        return transcription.text.strip()
+
+    def _request_with_retry(self, audio_data, samplerate):
+        """Sends one request, retrying transient failures with jittered exponential backoff."""
+        attempt = 0
+        while True:
+            try:
+                return self._request(audio_data, samplerate)
+            except TRANSIENT_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = random.uniform(0, self.retry_backoff * (2 ** attempt))
+                attempt += 1
+                metrics.increment('cloud_retries_total')
+                print(f"Cloud request failed ({e}). Retrying in {delay:.1f}s (attempt {attempt} of {self.max_retries})...")
+                time.sleep(delay)
+
+    def _split(self, audio_data, samplerate):
+        if self.chunk_seconds <= 0 or self.max_parallel_requests == 1:
+            return [audio_data]
+        return split_at_silence(audio_data, samplerate, self.chunk_seconds)
 
     def transcribe_audio(self, audio_data, samplerate=16000):
         if audio_data.size == 0:
             print("No audio data to transcribe.")
             return ""
 
+        if not self.circuit_breaker.allow_request():
+            metrics.increment('cloud_circuit_rejections_total')
+            raise CloudTranscriptionError("Cloud engine is temporarily unavailable after repeated failures.")
+
         print("Transcribing audio via OpenAI API...")
         try:
-            # OpenAI API requires a file path, so we write to a temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_audio_file:
-                sf.write(tmp_audio_file.name, audio_data, samplerate)
-                
-                with open(tmp_audio_file.name, "rb") as audio_file:
-                    transcription = self.client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file
-                    )
-                
-            os.remove(tmp_audio_file.name) # Clean up the temporary file
-            
-            print(f"Cloud transcription complete: {transcription.text}")
-            return transcription.text.strip()
-            
+            chunks = self._split(audio_data, samplerate)
+            if len(chunks) == 1:
+                text = self._request_with_retry(audio_data, samplerate)
+            else:
+                print(f"Sending {len(chunks)} chunks as concurrent requests...")
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_parallel_requests)
+                # map() yields results in chunk order, whatever order they finish in
+                texts = self._executor.map(lambda chunk: self._request_with_retry(chunk, samplerate), chunks)
+                text = " ".join(t for t in texts if t)
         except Exception as e:
-            print(f"An error occurred during cloud transcription: {e}")
             # This could be due to an invalid API key, network issues, etc.
-            return f"Error: {e}" 
\ No newline at end of file
+            print(f"An error occurred during cloud transcription: {e}")
+            self.circuit_breaker.record_failure()
+            metrics.increment('cloud_transcription_failures_total')
+            raise CloudTranscriptionError(str(e)) from e
+
+        self.circuit_breaker.record_success()
+        print(f"Cloud transcription complete: {text}")
+        return text
@@ -3,11 +3,7 @@ from .settings import Settings
 import os
 from queue import Empty
 import tkinter as tk
-# We use a try-except block to make torch an optional dependency
-try:
-    import torch
-except ImportError:
-    torch = None
+from .transcriber import get_capabilities, DECODING_PROFILES
 
 class ControlPanel(ctk.CTk):
     def __init__(self, settings: Settings, on_close_callback=None, is_model_downloaded_callback=None, download_model_callback=None, download_queue=None, are_local_dependencies_installed=None, install_local_dependencies_callback=None):
@@ -114,6 +110,16 @@ class ControlPanel(ctk.CTk):
         # Download Button
         self.download_button = ctk.CTkButton(self.local_settings_frame, text="Download Model", command=self.on_download_click)
 
+        # Decoding Profile Dropdown
+        self.decoding_profile_label = ctk.CTkLabel(self.local_settings_frame, text="Decoding Profile:")
+        self.decoding_profile_label.pack(pady=(5,0), padx=10, anchor="w")
+        self.decoding_profile_var = ctk.StringVar(value=self.settings.get_local('decoding_profile'))
+        self.decoding_profile_menu = ctk.CTkOptionMenu(self.local_settings_frame, variable=self.decoding_profile_var,
+                                                       values=list(DECODING_PROFILES))
+        self.decoding_profile_menu.pack(pady=5, padx=10, fill="x")
+        ctk.CTkLabel(self.local_settings_frame, text="'fast' has the lowest latency, 'accurate' makes the fewest mistakes",
+                     font=("Arial", 10), text_color="gray").pack(padx=10, anchor="w")
+
         # OpenAI Settings Frame
         self.openai_frame = ctk.CTkFrame(transcription_frame)
         ctk.CTkLabel(self.openai_frame, text="OpenAI API Key:").pack(pady=(5,0), padx=10, anchor="w")
@@ -130,8 +136,11 @@ class ControlPanel(ctk.CTk):
         self.check_download_queue() # Start polling for download results
 
     def is_cuda_available(self):
-        # Check if torch was imported and if cuda is available
-        return torch is not None and torch.cuda.is_available()
+        # Torch is optional and slow to import, so only load it when asked
+        if not get_capabilities().get('torch'):
+            return False
+        import torch
+        return torch.cuda.is_available()
 
     def update_local_transcriber_ui(self):
         """Shows/hides UI elements based on whether local dependencies are installed."""
@@ -187,7 +196,7 @@ class ControlPanel(ctk.CTk):
             self.download_button.pack_forget() # Hide button if downloaded
         else:
             self.model_status_label.configure(text="Status: Not Downloaded", text_color="orange")
-            self.download_button.pack(pady=5, padx=10, fill="x") # Show button
+            self.download_button.pack(pady=5, padx=10, fill="x", before=self.decoding_profile_label) # Show button
 
     def on_download_click(self):
         """Called when the 'Download Model' button is clicked."""
@@ -209,7 +218,7 @@ class ControlPanel(ctk.CTk):
             self.model_status_label.configure(text="Status: Downloaded", text_color="gray")
         else:
             self.model_status_label.configure(text="Status: Download failed", text_color="red")
-            self.download_button.pack(pady=5, padx=10, fill="x") # Show button again on failure
+            self.download_button.pack(pady=5, padx=10, fill="x", before=self.decoding_profile_label) # Show button again on failure
         
     def set_ui_state(self, state: str):
         """Disables or enables key UI elements."""
@@ -217,6 +226,7 @@ class ControlPanel(ctk.CTk):
         self.local_radio.configure(state=state)
         self.openai_radio.configure(state=state)
         self.model_size_menu.configure(state=state)
+        self.decoding_profile_menu.configure(state=state)
         self.api_key_var.get() # No easy way to disable entry, but this is fine
         self.mode_var.get() # Radios are not easily disabled as a group
 
@@ -229,22 +239,25 @@ class ControlPanel(ctk.CTk):
         else: # openai
             self.local_frame.pack_forget()
             self.openai_frame.pack(pady=5, padx=20, fill="x", expand=True)
-        self.settings.set('General', 'engine_type', self.engine_var.get())
-        self.settings.set('General', 'device', self.device_var.get())
-        self.settings.set('Local', 'model_size', self.model_size_var.get())
-        self.settings.set('OpenAI', 'api_key', self.api_key_entry.get())
+        with self.settings.batch():
+            self.settings.set('General', 'engine_type', self.engine_var.get())
+            self.settings.set('General', 'device', self.device_var.get())
+            self.settings.set('Local', 'model_size', self.model_size_var.get())
+            self.settings.set('OpenAI', 'api_key', self.api_key_entry.get())
 
     def save_settings(self):
         """Saves all the current settings from the UI."""
         # Get hotkey directly from the entry widget since textvariable binding isn't working
         hotkey_value = self.hotkey_entry.get()
         print(f"Saving hotkey: '{hotkey_value}'")
-        self.settings.set('General', 'hotkey_mode', self.mode_var.get())
-        self.settings.set('General', 'hotkey', hotkey_value)
-        self.settings.set('General', 'engine_type', self.engine_var.get())
-        self.settings.set('General', 'device', self.device_var.get())
-        self.settings.set('Local', 'model_size', self.model_size_var.get())
-        self.settings.set('OpenAI', 'api_key', self.api_key_entry.get())
+        with self.settings.batch():
+            self.settings.set('General', 'hotkey_mode', self.mode_var.get())
+            self.settings.set('General', 'hotkey', hotkey_value)
+            self.settings.set('General', 'engine_type', self.engine_var.get())
+            self.settings.set('General', 'device', self.device_var.get())
+            self.settings.set('Local', 'model_size', self.model_size_var.get())
+            self.settings.set('Local', 'decoding_profile', self.decoding_profile_var.get())
+            self.settings.set('OpenAI', 'api_key', self.api_key_entry.get())
         print("Settings saved to config file")
 
     def on_closing(self):
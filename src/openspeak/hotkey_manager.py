@@ -5,62 +5,99 @@ class HotkeyManager:
     def __init__(self, press_callback, release_callback):
         self.press_callback = press_callback
         self.release_callback = release_callback
-        
+
         self.hotkey = "right shift"
         self.hotkey_keys = ["right shift"]
         self.mode = "hold" # "hold" or "toggle"
-        
+
         self._hotkey_pressed = False
         self._toggle_state = False
         self.listener_thread = None
 
+        # Scan codes of the keys currently held, tracked from the event stream
+        # so the hook never has to query the OS
+        self._pressed = set()
+        self._compile()
+
     def _parse_hotkey(self, hotkey_str):
         """Split a hotkey string like 'ctrl+space' into a list of key names."""
         return [k.strip().lower() for k in hotkey_str.split('+') if k.strip()]
 
+    def _scan_codes(self, key):
+        """
+        Scan codes that satisfy a hotkey key. The keyboard library resolves
+        aliases, so 'win' matches either Windows key and 'control' matches
+        'ctrl'; 'ctrl' matches either side, 'right ctrl' only the right one.
+        """
+        try:
+            return frozenset(keyboard.key_to_scan_codes(key))
+        except Exception as e:
+            print(f"Unknown hotkey key '{key}': {e}")
+            return frozenset()
+
+    def _compile(self):
+        """Precomputes the scan code sets the event handler checks against."""
+        keys = self.hotkey_keys or [""]
+        self._primary_codes = self._scan_codes(keys[-1])
+        self._modifier_codes = [self._scan_codes(k) for k in keys[:-1]]
+        self._hotkey_codes = self._primary_codes.union(*self._modifier_codes)
+
     def set_config(self, hotkey, mode):
         self.hotkey = hotkey.strip()
         self.hotkey_keys = self._parse_hotkey(self.hotkey)
         self.mode = mode
+        self._compile()
+
+    def hotkey_held(self):
+        """True while any key of the hotkey is held down, from the hook's own key state."""
+        return not self._hotkey_codes.isdisjoint(self._pressed)
 
     # ---------------- Hold-to-talk logic ----------------
     def _all_keys_pressed(self):
         """Return True if *all* keys in the hotkey combo are currently pressed."""
-        return all(keyboard.is_pressed(k) for k in self.hotkey_keys)
+        return all(not codes.isdisjoint(self._pressed) for codes in self._modifier_codes)
 
-    def _handle_hold_mode(self, event):
+    def _handle_hold_mode(self, is_down):
         # Trigger only on the key-down / key-up of the *last* key in the combo
-        primary_key = self.hotkey_keys[-1]
-        if event.name != primary_key:
-            return
-
-        if event.event_type == keyboard.KEY_DOWN and not self._hotkey_pressed:
+        if is_down and not self._hotkey_pressed:
             if self._all_keys_pressed():
                 self._hotkey_pressed = True
                 self.press_callback()
-        elif event.event_type == keyboard.KEY_UP and self._hotkey_pressed:
+        elif not is_down and self._hotkey_pressed:
             # any release of primary key ends the hold
             self._hotkey_pressed = False
             self.release_callback()
 
     # ---------------- Toggle logic ----------------
-    def _handle_toggle_mode(self, event):
-        primary_key = self.hotkey_keys[-1]
-        if event.event_type == keyboard.KEY_DOWN and event.name == primary_key:
-            if self._all_keys_pressed():
-                if not self._toggle_state:
-                    self._toggle_state = True
-                    self.press_callback()
-                else:
-                    self._toggle_state = False
-                    self.release_callback()
+    def _handle_toggle_mode(self, is_down):
+        if is_down and self._all_keys_pressed():
+            if not self._toggle_state:
+                self._toggle_state = True
+                self.press_callback()
+            else:
+                self._toggle_state = False
+                self.release_callback()
 
     # ---------------- Event dispatcher ----------------
     def _key_event_handler(self, event):
+        # Called for every keystroke system-wide, so keep the common path cheap
+        scan_code = event.scan_code
+        if event.event_type == keyboard.KEY_DOWN:
+            if scan_code in self._pressed:
+                return  # Auto-repeat of a key that is already down
+            self._pressed.add(scan_code)
+            is_down = True
+        else:
+            self._pressed.discard(scan_code)
+            is_down = False
+
+        if scan_code not in self._primary_codes:
+            return
+
         if self.mode == "hold":
-            self._handle_hold_mode(event)
+            self._handle_hold_mode(is_down)
         elif self.mode == "toggle":
-            self._handle_toggle_mode(event)
+            self._handle_toggle_mode(is_down)
 
     # ------------- Listener control ----------------
     def start_listening(self):
@@ -73,4 +110,5 @@ class HotkeyManager:
         keyboard.unhook_all()
         self._hotkey_pressed = False
         self._toggle_state = False
-        print("Hotkey listener stopped.") 
\ No newline at end of file
+        self._pressed.clear()
+        print("Hotkey listener stopped.")
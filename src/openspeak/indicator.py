@@ -46,7 +46,8 @@ class Indicator:
         states = {
             "idle": ("IDLE", "green"),
             "listening": ("LISTENING", "red"),
-            "thinking": ("THINKING...", "orange")
+            "thinking": ("THINKING...", "orange"),
+            "warming_up": ("WARMING UP...", "purple")
         }
         
         text, color = states.get(state.lower(), ("UNKNOWN", "grey"))
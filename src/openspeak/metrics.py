@@ -0,0 +1,155 @@
+# metrics.py
+# This module records runtime counters and latency histograms for the
+# dictation pipeline, and can expose them over local HTTP or write them to a
+# file periodically.
+
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .atomic_file import atomic_write
+
+class Histogram:
+    """Tracks count, sum, min and max of all samples, plus quantiles over the most recent ones."""
+
+    def __init__(self, window=1024):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._recent = deque(maxlen=window)
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self._recent.append(value)
+
+    def snapshot(self):
+        recent = sorted(self._recent)
+
+        def quantile(q):
+            if not recent:
+                return None
+            return recent[min(len(recent) - 1, int(q * len(recent)))]
+
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': quantile(0.5),
+            'p90': quantile(0.9),
+            'p99': quantile(0.99),
+        }
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name, value):
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name, value):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(value)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'timestamp': time.time(),
+                'counters': dict(self._counters),
+                'gauges': dict(self._gauges),
+                'histograms': {name: h.snapshot() for name, h in self._histograms.items()},
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+# Shared registry used by all modules
+metrics = MetricsRegistry()
+
+class MetricsHTTPServer:
+    """Serves the registry snapshot as JSON on http://127.0.0.1:<port>/metrics."""
+
+    def __init__(self, registry, port):
+        self.registry = registry
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        host, port = self._server.server_address
+        print(f"Metrics available at http://{host}:{port}/metrics")
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') != '/metrics':
+                    self.send_error(404)
+                    return
+                data = json.dumps(registry.snapshot(), indent=2).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass  # Don't print a line for every scrape
+
+        return Handler
+
+class MetricsFileWriter:
+    """Writes the registry snapshot as JSON to a file every interval seconds."""
+
+    def __init__(self, registry, path, interval=60.0):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        print(f"Writing metrics to '{self.path}' every {self.interval:g}s.")
+
+    def stop(self):
+        self._stop_event.set()
+        self._thread.join()
+        self.write()
+
+    def write(self):
+        try:
+            with atomic_write(self.path) as metrics_file:
+                json.dump(self.registry.snapshot(), metrics_file, indent=2)
+        except OSError as e:
+            print(f"Failed to write metrics file: {e}")
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.write()
@@ -0,0 +1,147 @@
+# model_cache.py
+# This module answers "is model X downloaded?" from the files in the local
+# model cache, without importing faster-whisper or loading the model.
+
+import os
+import threading
+
+# Files faster-whisper needs to load a converted CTranslate2 model
+REQUIRED_FILES = ("model.bin", "config.json", "tokenizer.json")
+VOCABULARY_FILES = ("vocabulary.txt", "vocabulary.json")
+
+# Model names faster-whisper accepts and the Hugging Face repos it downloads
+# them from (mirrors faster_whisper.utils._MODELS as of faster-whisper 1.2)
+FASTER_WHISPER_MODELS = {
+    "tiny.en": "Systran/faster-whisper-tiny.en",
+    "tiny": "Systran/faster-whisper-tiny",
+    "base.en": "Systran/faster-whisper-base.en",
+    "base": "Systran/faster-whisper-base",
+    "small.en": "Systran/faster-whisper-small.en",
+    "small": "Systran/faster-whisper-small",
+    "medium.en": "Systran/faster-whisper-medium.en",
+    "medium": "Systran/faster-whisper-medium",
+    "large-v1": "Systran/faster-whisper-large-v1",
+    "large-v2": "Systran/faster-whisper-large-v2",
+    "large-v3": "Systran/faster-whisper-large-v3",
+    "large": "Systran/faster-whisper-large-v3",
+    "distil-large-v2": "Systran/faster-distil-whisper-large-v2",
+    "distil-medium.en": "Systran/faster-distil-whisper-medium.en",
+    "distil-small.en": "Systran/faster-distil-whisper-small.en",
+    "distil-large-v3": "Systran/faster-distil-whisper-large-v3",
+    "distil-large-v3.5": "distil-whisper/distil-large-v3.5-ct2",
+    "large-v3-turbo": "mobiuslabsgmbh/faster-whisper-large-v3-turbo",
+    "turbo": "mobiuslabsgmbh/faster-whisper-large-v3-turbo",
+}
+
+def repo_id_for(model_size):
+    """
+    Maps a model size like 'tiny.en' to the Hugging Face repo faster-whisper
+    downloads it from. Returns None for names this table doesn't know.
+    """
+    if "/" in model_size:
+        return model_size
+    return FASTER_WHISPER_MODELS.get(model_size)
+
+def probe_with_faster_whisper(model_size, cache_path):
+    """Asks faster-whisper whether it can find the model without network access. Slower than the index."""
+    try:
+        from faster_whisper.utils import download_model
+        path = download_model(model_size, local_files_only=True, cache_dir=cache_path)
+    except Exception:
+        return False
+    return is_complete_model_dir(path)
+
+def is_complete_model_dir(path):
+    """Returns True if the directory holds every file needed to load the model."""
+    if not all(os.path.isfile(os.path.join(path, name)) for name in REQUIRED_FILES):
+        return False
+    if not any(os.path.isfile(os.path.join(path, name)) for name in VOCABULARY_FILES):
+        return False
+    return os.path.getsize(os.path.join(path, "model.bin")) > 0
+
+class ModelCacheIndex:
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self._entries = {}  # model_size -> (signature, is_present)
+        self._lock = threading.Lock()
+
+    def _repo_dir(self, model_size):
+        repo_id = repo_id_for(model_size)
+        if repo_id is None:
+            return None
+        return os.path.join(self.cache_path, "models--" + repo_id.replace("/", "--"))
+
+    def _signature(self, repo_dir):
+        """Modification times of the directories a download writes to."""
+        stamps = []
+        for sub in ("", "refs", "snapshots", "blobs"):
+            try:
+                stamps.append(os.stat(os.path.join(repo_dir, sub)).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def _scan(self, repo_dir):
+        """Checks the snapshot the cache's 'main' ref points to, falling back to any complete snapshot."""
+        return self._complete_snapshot(repo_dir) is not None
+
+    def _complete_snapshot(self, repo_dir):
+        """Returns the path of a complete snapshot, preferring the one 'main' points to, or None."""
+        snapshots_dir = os.path.join(repo_dir, "snapshots")
+        try:
+            with open(os.path.join(repo_dir, "refs", "main")) as ref_file:
+                revision = ref_file.read().strip()
+            if is_complete_model_dir(os.path.join(snapshots_dir, revision)):
+                return os.path.join(snapshots_dir, revision)
+        except OSError:
+            pass
+
+        try:
+            revisions = os.listdir(snapshots_dir)
+        except OSError:
+            return None
+        for rev in revisions:
+            if is_complete_model_dir(os.path.join(snapshots_dir, rev)):
+                return os.path.join(snapshots_dir, rev)
+        return None
+
+    def model_file_size(self, model_size):
+        """Size in bytes of the model's weights file on disk, or None if it is not downloaded."""
+        if os.path.isdir(model_size):
+            path = model_size if is_complete_model_dir(model_size) else None
+        else:
+            repo_dir = self._repo_dir(model_size)
+            path = self._complete_snapshot(repo_dir) if repo_dir else None
+        if path is None:
+            return None
+        return os.path.getsize(os.path.join(path, "model.bin"))
+
+    def is_present(self, model_size):
+        """Returns True if the model is fully downloaded. Results are cached until the cache directory changes."""
+        if not model_size:
+            return False
+        if os.path.isdir(model_size):
+            return is_complete_model_dir(model_size)
+
+        repo_dir = self._repo_dir(model_size)
+        if repo_dir is None:
+            # A name added in a newer faster-whisper: let it resolve the name
+            return probe_with_faster_whisper(model_size, self.cache_path)
+        signature = self._signature(repo_dir)
+        with self._lock:
+            entry = self._entries.get(model_size)
+            if entry and entry[0] == signature:
+                return entry[1]
+
+        present = self._scan(repo_dir)
+        with self._lock:
+            self._entries[model_size] = (signature, present)
+        return present
+
+    def invalidate(self, model_size=None):
+        """Drops cached results for one model, or for all models."""
+        with self._lock:
+            if model_size is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(model_size, None)
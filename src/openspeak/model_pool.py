@@ -0,0 +1,145 @@
+# model_pool.py
+# This module keeps recently used loaded models in memory, so switching back
+# to one of them in the Settings window doesn't reload it from disk.
+
+import ctypes
+import os
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+
+from .metrics import metrics
+
+# Share of RAM (or GPU memory) pooled models may use when no budget is configured
+AUTO_BUDGET_FRACTION = 0.25
+
+def total_memory_mb(device='cpu'):
+    """Physical RAM, or the first GPU's memory for 'cuda', in MB. None if it can't be determined."""
+    try:
+        if device == 'cuda':
+            # Asked from outside the process, so no CUDA context is created here
+            output = subprocess.run(
+                ['nvidia-smi', '--query-gpu=memory.total', '--format=csv,noheader,nounits', '--id=0'],
+                capture_output=True, text=True, timeout=5, check=True,
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+            ).stdout
+            return int(output.split()[0])
+        if sys.platform == 'win32':
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [('dwLength', ctypes.c_ulong), ('dwMemoryLoad', ctypes.c_ulong),
+                            ('ullTotalPhys', ctypes.c_ulonglong), ('ullAvailPhys', ctypes.c_ulonglong),
+                            ('ullTotalPageFile', ctypes.c_ulonglong), ('ullAvailPageFile', ctypes.c_ulonglong),
+                            ('ullTotalVirtual', ctypes.c_ulonglong), ('ullAvailVirtual', ctypes.c_ulonglong),
+                            ('ullAvailExtendedVirtual', ctypes.c_ulonglong)]
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return None
+            return status.ullTotalPhys // (1024 * 1024)
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except Exception:
+        return None
+
+def auto_budget_mb(device='cpu'):
+    """Default pool memory budget: a share of the device's memory, or None if it is unknown."""
+    total = total_memory_mb(device)
+    return int(total * AUTO_BUDGET_FRACTION) if total else None
+
+class ModelPool:
+    """
+    Least-recently-used pool of loaded models. Holds at most capacity models
+    and, if max_memory_mb is set, at most that much estimated model memory.
+    The most recently used model is always kept, even if it alone is over budget.
+    """
+
+    def __init__(self, capacity=1, max_memory_mb=0):
+        self.capacity = capacity
+        self.max_memory_mb = max_memory_mb
+        self._models = OrderedDict()  # key -> (model, size in bytes or None), least recent first
+        self._lock = threading.Lock()
+        self._auto_budget_device = None  # Device whose memory sets the budget, until it is resolved
+
+    def configure(self, capacity, max_memory_mb=0, device='cpu'):
+        """
+        max_memory_mb='auto' derives the budget from the device's memory. That
+        is looked up on the first put(), i.e. on the thread loading a model,
+        so configuring never blocks the caller.
+        """
+        with self._lock:
+            self.capacity = max(1, int(capacity))
+            if max_memory_mb == 'auto':
+                self._auto_budget_device = device
+                max_memory_mb = 0
+            else:
+                self._auto_budget_device = None
+            self.max_memory_mb = max_memory_mb
+            evicted = self._evict()
+        self._report(evicted)
+
+    def _resolve_auto_budget(self):
+        device = self._auto_budget_device
+        budget = auto_budget_mb(device)
+        with self._lock:
+            if self._auto_budget_device != device:
+                return  # Reconfigured meanwhile
+            self._auto_budget_device = None
+            if budget is None:
+                # Without a memory budget, only keep the active model
+                print("Could not determine available memory. Keeping only the active model loaded.")
+                self.capacity = 1
+            else:
+                self.max_memory_mb = budget
+
+    def get(self, key):
+        """Returns the pooled model for key and marks it most recently used, or None."""
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is None:
+                return None
+            self._models.move_to_end(key)
+        metrics.increment('model_pool_hits_total')
+        return entry[0]
+
+    def put(self, key, model, size_bytes=None):
+        """Adds a loaded model as the most recently used one, evicting others if over budget."""
+        if self._auto_budget_device is not None:
+            self._resolve_auto_budget()
+        with self._lock:
+            self._models[key] = (model, size_bytes)
+            self._models.move_to_end(key)
+            evicted = self._evict()
+        self._report(evicted)
+
+    def discard(self, key):
+        with self._lock:
+            self._models.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+    def keys(self):
+        with self._lock:
+            return list(self._models)
+
+    def memory_bytes(self):
+        with self._lock:
+            return sum(size or 0 for _, size in self._models.values())
+
+    def _evict(self):
+        """Drops least recently used models until within budget. Call with the lock held."""
+        evicted = []
+        budget = self.max_memory_mb * 1024 * 1024
+        while len(self._models) > 1:
+            used = sum(size or 0 for _, size in self._models.values())
+            if len(self._models) <= self.capacity and not (budget and used > budget):
+                break
+            key, _ = self._models.popitem(last=False)
+            evicted.append(key)
+        return evicted
+
+    def _report(self, evicted):
+        for key in evicted:
+            print(f"Model pool full. Unloaded least recently used model '{key[0]}' ({key[1]}, {key[2]}).")
+            metrics.increment('model_pool_evictions_total')
@@ -0,0 +1,142 @@
+# pipeline.py
+# This module runs transcription jobs on a fixed pool of worker threads and
+# injects their results in the order the clips were recorded.
+
+import threading
+import queue
+import time
+
+from .metrics import metrics
+from .tracing import tracer
+
+class TranscriptionPipeline:
+    def __init__(self, inject_callback, on_idle=None, num_workers=1, max_pending=8):
+        self.inject_callback = inject_callback
+        self.on_idle = on_idle
+        self.max_pending = max_pending
+
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._inject_lock = threading.Lock()
+        self._next_seq = 0       # Sequence number for the next submitted job
+        self._next_inject = 0    # Sequence number of the next result to inject
+        self._results = {}       # Finished results waiting for earlier jobs
+        self._submitted_at = {}  # seq -> submit time, until the job is injected
+        self._awaiting_text = set()  # Jobs that have not injected any text yet
+        self._workers = []
+        self.num_workers = 0
+        self.set_workers(num_workers)
+
+    def set_workers(self, num_workers):
+        """Grows or shrinks the worker pool."""
+        num_workers = max(1, int(num_workers))
+        with self._lock:
+            while self.num_workers < num_workers:
+                worker = threading.Thread(target=self._worker_loop, daemon=True,
+                                          name=f"transcription-worker-{len(self._workers) + 1}")
+                self._workers.append(worker)
+                worker.start()
+                self.num_workers += 1
+            while self.num_workers > num_workers:
+                self._jobs.put(None)  # Tells one worker to exit
+                self.num_workers -= 1
+
+    def depth(self):
+        """Number of jobs submitted but not yet injected."""
+        with self._lock:
+            return self._next_seq - self._next_inject
+
+    def submit(self, task):
+        """
+        Queues a job. task is a callable that returns the text to inject, or
+        an iterable of text pieces; pieces are injected as soon as they are
+        produced once every earlier job has been injected.
+        Returns False without queuing if the pipeline is already full.
+        """
+        with self._lock:
+            depth = self._next_seq - self._next_inject
+            if depth >= self.max_pending:
+                print(f"Transcription queue is full ({depth} pending). Dropping clip.")
+                metrics.increment('clips_dropped_total')
+                return False
+            seq = self._next_seq
+            self._next_seq += 1
+            submitted_at = time.perf_counter()
+            self._submitted_at[seq] = submitted_at
+            self._awaiting_text.add(seq)
+        metrics.set_gauge('transcription_queue_depth', depth + 1)
+        self._jobs.put((seq, task, submitted_at))
+        if depth:
+            print(f"Transcription queued behind {depth} job(s).")
+        return True
+
+    def _worker_loop(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                with self._lock:
+                    self._workers.remove(threading.current_thread())
+                return
+            seq, task, submitted_at = job
+            metrics.observe('queue_wait_seconds', time.perf_counter() - submitted_at)
+            pieces = []
+            with tracer.span('transcription job', seq=seq):
+                try:
+                    result = task()
+                    if isinstance(result, str):
+                        pieces.append(result)
+                    else:
+                        for piece in result:
+                            pieces.append(piece)
+                            # Inject right away if every earlier job is done, else hold on to it
+                            if self._is_next(seq):
+                                self._inject_pieces(seq, pieces)
+                                pieces = []
+                except Exception as e:
+                    print(f"Transcription job failed: {e}")
+            with self._lock:
+                self._results[seq] = pieces
+            self._inject_ready()
+
+    def _is_next(self, seq):
+        with self._lock:
+            return self._next_inject == seq
+
+    def _inject_pieces(self, seq, pieces):
+        # Only one thread injects at a time, so text cannot interleave
+        with self._inject_lock:
+            for text in pieces:
+                if text:
+                    self._inject(seq, text)
+
+    def _inject(self, seq, text):
+        self.inject_callback(text)
+        with self._lock:
+            first_text = seq in self._awaiting_text
+            self._awaiting_text.discard(seq)
+            submitted_at = self._submitted_at[seq]
+        if first_text:
+            metrics.observe('release_to_first_text_seconds', time.perf_counter() - submitted_at)
+
+    def _inject_ready(self):
+        """Injects every finished result whose predecessors have been injected."""
+        with self._inject_lock:
+            while True:
+                with self._lock:
+                    if self._next_inject not in self._results:
+                        return
+                    seq = self._next_inject
+                    pieces = self._results.pop(seq)
+                for text in pieces:
+                    if text:
+                        self._inject(seq, text)
+                with self._lock:
+                    submitted_at = self._submitted_at.pop(seq)
+                    self._awaiting_text.discard(seq)
+                    self._next_inject += 1
+                    depth = self._next_seq - self._next_inject
+                    idle = depth == 0
+                metrics.observe('release_to_text_seconds', time.perf_counter() - submitted_at)
+                metrics.set_gauge('transcription_queue_depth', depth)
+                if idle and self.on_idle:
+                    self.on_idle()
@@ -0,0 +1,59 @@
+# preprocessing.py
+# This module prepares recorded audio before it is sent to a transcriber.
+
+import numpy as np
+
+def frame_energy_db(audio, frame_samples):
+    """Returns the RMS level of each full frame of the clip in dBFS."""
+    n_frames = audio.size // frame_samples
+    if n_frames == 0:
+        return np.empty(0, dtype=np.float32)
+    frames = audio[:n_frames * frame_samples].reshape(n_frames, frame_samples)
+    power = np.einsum('ij,ij->i', frames, frames) / frame_samples
+    return 10.0 * np.log10(power + 1e-12)
+
+def trim_silence(audio, samplerate=16000, threshold_db=-45.0, frame_ms=20, padding_ms=200, min_speech_ms=100):
+    """
+    Trims leading and trailing silence from a mono float32 clip.
+    Returns a view into the original clip, or an empty array if the clip
+    holds less than min_speech_ms of audio above the threshold.
+    """
+    frame_samples = max(1, int(samplerate * frame_ms / 1000))
+    energy_db = frame_energy_db(audio, frame_samples)
+    voiced = np.flatnonzero(energy_db > threshold_db)
+
+    if voiced.size * frame_ms < min_speech_ms:
+        return audio[:0]
+
+    padding = int(samplerate * padding_ms / 1000)
+    start = max(0, voiced[0] * frame_samples - padding)
+    end = min(audio.size, (voiced[-1] + 1) * frame_samples + padding)
+    return audio[start:end]
+
+def find_quiet_cut(window, samplerate=16000, search_seconds=2.0, frame_ms=20):
+    """
+    Returns an index near the end of the window that falls in its quietest
+    frame, so a clip cut there tends to end in a pause rather than mid-word.
+    """
+    frame_samples = max(1, int(samplerate * frame_ms / 1000))
+    search_samples = min(int(search_seconds * samplerate), window.size // 2)
+    search = window[window.size - search_samples:]
+    energy = frame_energy_db(search, frame_samples)
+    if energy.size == 0:
+        return window.size
+    quietest = int(np.argmin(energy))
+    return window.size - search.size + (quietest + 1) * frame_samples
+
+def split_at_silence(audio, samplerate=16000, chunk_seconds=20.0, search_seconds=2.0):
+    """Splits a clip into chunks of at most chunk_seconds, cut at low-energy points. Returns views."""
+    # At least one sample per chunk, or the loop would never advance
+    chunk_samples = max(1, int(chunk_seconds * samplerate))
+    chunks = []
+    start = 0
+    while audio.size - start > chunk_samples:
+        cut = find_quiet_cut(audio[start:start + chunk_samples], samplerate, search_seconds)
+        chunks.append(audio[start:start + cut])
+        start += cut
+    if start < audio.size:
+        chunks.append(audio[start:])
+    return chunks
@@ -1,20 +1,46 @@
 import configparser
+import contextlib
 import os
+import threading
+
+from .atomic_file import atomic_write
 
 class Settings:
     def __init__(self, file_name="config.ini"):
         self.file_name = file_name
         self.config = configparser.ConfigParser()
+        self._dirty = set()        # (section, option) pairs changed since the last save
+        self._batch_depth = 0
+        self._file_stamp = None    # (mtime, size) of the file when last read or written
+        # Held while the config is read, changed or written. Background threads
+        # (e.g. the autotuner) and the GUI both write settings.
+        self.lock = threading.RLock()
         self.load()
 
+    def _stat_file(self):
+        try:
+            stat = os.stat(self.file_name)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def load(self):
         """
         Loads configuration from the file.
         If the file doesn't exist, or if it's missing sections or options,
         it populates them with default values and saves the file.
         It also handles migrating settings from the installer.
+        Does nothing if the file hasn't changed since it was last read or written.
         """
+        with self.lock:
+            self._load()
+
+    def _load(self):
+        stamp = self._stat_file()
+        if stamp is not None and stamp == self._file_stamp:
+            return
         self.config.read(self.file_name)
+        self._file_stamp = stamp
 
         # One-time migration from installer config
         needs_saving = False
@@ -43,13 +69,45 @@ class Settings:
                 'hotkey_mode': 'hold',
                 'hotkey': 'ctrl+space',
                 'device': 'cpu',
-                'first_run_complete': 'false'
+                'first_run_complete': 'false',
+                'streaming': 'false',
+                'stream_chunk_seconds': '10',
+                'trim_silence': 'true',
+                'silence_threshold_db': '-45',
+                'transcription_workers': '1',
+                'transcription_queue_size': '8',
+                'injection_mode': 'auto',
+                'paste_threshold': '100'
             },
             'Local': {
-                'model_size': 'tiny.en'
+                'model_size': 'tiny.en',
+                'warmup': 'true',
+                'autotune': 'false',
+                'compute_type': 'auto',
+                'cpu_threads': 'auto',
+                'batch_threshold_seconds': '60',
+                'batch_size': '8',
+                'decoding_profile': 'accurate',
+                'idle_unload_minutes': '0',
+                'model_pool_size': '2',
+                'model_pool_memory_mb': 'auto'
             },
             'OpenAI': {
-                'api_key': ''
+                'api_key': '',
+                'upload_format': 'flac',
+                'chunk_seconds': '20',
+                'max_parallel_requests': '4',
+                'request_timeout': '15',
+                'max_retries': '2'
+            },
+            'Metrics': {
+                'http_port': '0',
+                'file': '',
+                'interval_seconds': '60'
+            },
+            'Tracing': {
+                'enabled': 'false',
+                'file': 'openspeak-trace.json'
             }
         }
         
@@ -66,8 +124,32 @@ class Settings:
             self.save()
 
     def save(self):
-        with open(self.file_name, 'w') as configfile:
-            self.config.write(configfile)
+        """Writes the config atomically, keeping the file's permissions."""
+        with self.lock:
+            with atomic_write(self.file_name) as configfile:
+                self.config.write(configfile)
+            self._dirty.clear()
+            self._file_stamp = self._stat_file()
+
+    def commit(self):
+        """Saves pending changes, if there are any."""
+        if self._dirty:
+            self.save()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Groups several set() calls into a single write when the outermost batch
+        exits. Other threads cannot change settings until then.
+        """
+        with self.lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.commit()
 
     def get(self, section, option, fallback=None):
         return self.config.get(section, option, fallback=fallback)
@@ -82,7 +164,25 @@ class Settings:
         return self.get('OpenAI', option)
 
     def set(self, section, option, value):
-        if not self.config.has_section(section):
-            self.config.add_section(section)
-        self.config.set(section, option, str(value))
-        self.save() 
\ No newline at end of file
+        """Sets an option. Saved immediately, or when the enclosing batch() exits."""
+        value = str(value)
+        with self.lock:
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            elif self.config.get(section, option, fallback=None) == value:
+                return
+            self.config.set(section, option, value)
+            self._dirty.add((section, option))
+            if self._batch_depth == 0:
+                self.commit()
+
+    def clear_section(self, section):
+        """Removes every option in a section. Saved like set()."""
+        with self.lock:
+            if not self.config.has_section(section) or not self.config.options(section):
+                return
+            for option in self.config.options(section):
+                self.config.remove_option(section, option)
+                self._dirty.add((section, option))
+            if self._batch_depth == 0:
+                self.commit() 
\ No newline at end of file
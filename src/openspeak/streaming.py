@@ -0,0 +1,99 @@
+# streaming.py
+# This module transcribes audio in segments while the hotkey is still held,
+# so that only the last few seconds need decoding once recording stops.
+
+import threading
+import queue
+import numpy as np
+
+from .preprocessing import find_quiet_cut
+from .tracing import tracer
+
+class StreamingTranscriber:
+    def __init__(self, transcribe, samplerate=16000, chunk_seconds=10.0, search_seconds=2.0, frame_ms=20, preprocess=None):
+        # transcribe is a callable taking a clip and returning its text
+        self.transcribe = transcribe
+        self.preprocess = preprocess
+        self.samplerate = samplerate
+        # A segment must be long enough to search for a quiet cut point in it
+        chunk_seconds = max(chunk_seconds, search_seconds)
+        self.chunk_samples = max(1, int(chunk_seconds * samplerate))
+        self.search_seconds = search_seconds
+        self.frame_ms = frame_ms
+
+        self._q = queue.Queue()
+        self._thread = None
+        self._pending = []
+        self._pending_len = 0
+        self._texts = []
+        self._cancelled = False
+
+    def start(self):
+        """Starts the background decoder for a new recording."""
+        self._q = queue.Queue()
+        self._pending = []
+        self._pending_len = 0
+        self._texts = []
+        self._cancelled = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def feed(self, block):
+        """Queues a block of recorded audio. Safe to call from the audio callback."""
+        self._q.put(block)
+
+    def finish(self):
+        """Decodes whatever audio is left and returns the text of the whole recording."""
+        if self._thread is None:
+            return ""
+        self._q.put(None)
+        self._thread.join()
+        self._thread = None
+        return " ".join(text for text in self._texts if text).strip()
+
+    def cancel(self):
+        """Stops the background decoder without waiting for it or decoding the rest."""
+        if self._thread is None:
+            return
+        self._cancelled = True
+        self._q.put(None)
+        self._thread = None
+
+    def _run(self):
+        while True:
+            block = self._q.get()
+            if block is None:
+                break
+            block = block.reshape(-1)
+            self._pending.append(block)
+            self._pending_len += block.size
+            while self._pending_len >= self.chunk_samples and not self._cancelled:
+                self._decode_next_segment()
+
+        # Flush the tail once recording has stopped
+        if self._pending_len > 0 and not self._cancelled:
+            tail = np.concatenate(self._pending)
+            self._pending = []
+            self._pending_len = 0
+            self._transcribe(tail)
+
+    def _decode_next_segment(self):
+        audio = np.concatenate(self._pending)
+        cut = find_quiet_cut(audio[:self.chunk_samples], self.samplerate, self.search_seconds, self.frame_ms)
+        cut = max(cut, 1)  # Always consume audio, so the loop in _run ends
+        segment, rest = audio[:cut], audio[cut:]
+        self._pending = [rest] if rest.size else []
+        self._pending_len = rest.size
+        self._transcribe(segment)
+
+    def _transcribe(self, segment):
+        if self.preprocess:
+            segment = self.preprocess(segment)
+            if segment.size == 0:
+                print("Streaming: skipping silent segment.")
+                return
+        print(f"Streaming: decoding {segment.size / self.samplerate:.1f}s segment...")
+        with tracer.span('stream chunk', audio_seconds=segment.size / self.samplerate):
+            text = self.transcribe(segment)
+        if text:
+            self._texts.append(text)
@@ -1,22 +1,175 @@
 # text_injector.py
-# This module will handle injecting the transcribed text into the active window. 
+# This module will handle injecting the transcribed text into the active window.
 
-import keyboard
+import threading
 import time
 
-def inject_text(text):
-    if not text:
-        return
-        
-    # Add a small delay to ensure the user has released the hotkey
-    # and the target window has focus.
-    time.sleep(0.1)
-    
-    print(f"Injecting text: {text}")
-    try:
-        # keyboard.write is generally more reliable than clipboard methods
-        # and works in more applications.
+import keyboard
+
+from .tracing import tracer
+
+def wait_for_keys_released(keys_held, timeout=1.0, poll_interval=0.01):
+    """
+    Waits until keys_held() is false, so injected text isn't combined with
+    the user's modifiers. keys_held reads key state the caller already
+    tracks (e.g. HotkeyManager.hotkey_held), so the OS is never queried.
+    """
+    deadline = time.monotonic() + timeout
+    while keys_held() and time.monotonic() < deadline:
+        time.sleep(poll_interval)
+
+class TextInjector:
+    """Base class for injection backends. Subclasses implement send()."""
+
+    def __init__(self):
+        self.keys_held = None  # Callable that is true while the hotkey is held
+
+    def inject(self, text):
+        """Waits for the hotkey to be released, then sends the text. Errors are logged, not raised."""
+        if not text:
+            return
+        # Ensure the user has released the hotkey before we send keystrokes
+        if self.keys_held:
+            with tracer.span('wait for key release'):
+                wait_for_keys_released(self.keys_held)
+        print(f"Injecting text: {text}")
+        try:
+            with tracer.span('inject text', chars=len(text), backend=type(self).__name__):
+                self.send(text)
+        except Exception as e:
+            print(f"Failed to inject text: {e}")
+
+    def send(self, text):
+        """Enters the text into the active window right away."""
+        raise NotImplementedError
+
+class TypingInjector(TextInjector):
+    """Types the text one character at a time. Works in almost every application."""
+
+    def send(self, text):
         keyboard.write(text)
-    except Exception as e:
-        print(f"Failed to inject text: {e}")
-        # A fallback to clipboard could be implemented here in a real app. 
\ No newline at end of file
+
+# Clipboard formats holding GDI handles rather than memory. They can't be
+# copied byte for byte; Windows synthesizes CF_BITMAP from CF_DIB anyway.
+GDI_CLIPBOARD_FORMATS = {
+    2,       # CF_BITMAP
+    3,       # CF_METAFILEPICT
+    9,       # CF_PALETTE
+    14,      # CF_ENHMETAFILE
+    0x0080,  # CF_OWNERDISPLAY
+    0x0082,  # CF_DSPBITMAP
+    0x0083,  # CF_DSPMETAFILEPICT
+    0x008E,  # CF_DSPENHMETAFILE
+}
+
+class ClipboardInjector(TextInjector):
+    """
+    Pastes the text in one go through the clipboard, then restores the
+    previous clipboard contents in every format (text, images, files, ...).
+    Much faster than typing for long transcripts.
+    """
+
+    def __init__(self, restore_delay=0.2):
+        super().__init__()
+        self.restore_delay = restore_delay
+        self._clipboard_lock = threading.Lock()
+
+    def send(self, text):
+        try:
+            import win32clipboard
+        except ImportError:
+            print("Clipboard paste is unavailable on this system. Typing instead.")
+            keyboard.write(text)
+            return
+
+        with self._clipboard_lock:
+            previous = self._save_clipboard(win32clipboard)
+            self._set_clipboard_text(win32clipboard, text)
+            keyboard.send('ctrl+v')
+            # The target application reads the clipboard asynchronously
+            time.sleep(self.restore_delay)
+            # An empty clipboard is restored too, so the transcript doesn't linger there
+            self._restore_clipboard(win32clipboard, previous)
+
+    def _save_clipboard(self, win32clipboard):
+        """Returns the raw data of every clipboard format as a list of (format, bytes)."""
+        saved = []
+        win32clipboard.OpenClipboard()
+        try:
+            clipboard_format = win32clipboard.EnumClipboardFormats(0)
+            while clipboard_format:
+                if clipboard_format not in GDI_CLIPBOARD_FORMATS:
+                    try:
+                        handle = win32clipboard.GetClipboardDataHandle(clipboard_format)
+                        saved.append((clipboard_format, win32clipboard.GetGlobalMemory(handle)))
+                    except Exception as e:
+                        # Delayed-rendering owners may refuse to render some formats
+                        print(f"Could not save clipboard format {clipboard_format}: {e}")
+                clipboard_format = win32clipboard.EnumClipboardFormats(clipboard_format)
+        finally:
+            win32clipboard.CloseClipboard()
+        return saved
+
+    def _restore_clipboard(self, win32clipboard, saved):
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            for clipboard_format, data in saved:
+                try:
+                    win32clipboard.SetClipboardData(clipboard_format, data)
+                except Exception as e:
+                    print(f"Could not restore clipboard format {clipboard_format}: {e}")
+        finally:
+            win32clipboard.CloseClipboard()
+
+    def _set_clipboard_text(self, win32clipboard, text):
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
+        finally:
+            win32clipboard.CloseClipboard()
+
+class AutoInjector(TextInjector):
+    """Types short texts and pastes long ones."""
+
+    def __init__(self, paste_threshold=100):
+        super().__init__()
+        self.paste_threshold = paste_threshold
+        self.typing = TypingInjector()
+        self.clipboard = ClipboardInjector()
+
+    def send(self, text):
+        backend = self.clipboard if len(text) >= self.paste_threshold else self.typing
+        backend.send(text)
+
+class FakeInjector(TextInjector):
+    """
+    Records injected text instead of sending it anywhere, for benchmarks and
+    headless runs. char_delay simulates the per-character cost of typing.
+    """
+
+    def __init__(self, char_delay=0.0):
+        super().__init__()
+        self.char_delay = char_delay
+        self.injected = []  # (perf_counter timestamp, text)
+
+    def send(self, text):
+        if self.char_delay:
+            time.sleep(self.char_delay * len(text))
+        self.injected.append((time.perf_counter(), text))
+
+INJECTION_MODES = {
+    'type': TypingInjector,
+    'paste': ClipboardInjector,
+    'auto': AutoInjector,
+}
+
+def create_injector(mode='auto', paste_threshold=100):
+    """Builds the injector for an injection_mode setting."""
+    if mode == 'auto':
+        return AutoInjector(paste_threshold)
+    if mode not in INJECTION_MODES:
+        print(f"Unknown injection mode '{mode}'. Using 'auto'.")
+        return AutoInjector(paste_threshold)
+    return INJECTION_MODES[mode]()
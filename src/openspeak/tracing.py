@@ -0,0 +1,104 @@
+# tracing.py
+# This module records timed spans from any thread and writes them as a
+# Chrome trace (JSON), which can be opened in chrome://tracing or Perfetto.
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+
+from .atomic_file import atomic_write
+
+# Returned by span() while tracing is off, so a disabled span costs one check
+_NULL_SPAN = nullcontext()
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer._record(self.name, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+class Tracer:
+    def __init__(self, max_events=100000):
+        self.enabled = False
+        self._origin = time.perf_counter_ns()
+        # Oldest spans are dropped once the buffer is full
+        self._events = deque(maxlen=max_events)
+        self._thread_names = {}
+
+    def enable(self):
+        if not self.enabled:
+            self.clear()
+            self.enabled = True
+            print("Tracing enabled.")
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            print("Tracing disabled.")
+
+    def clear(self):
+        self._events.clear()
+        self._thread_names.clear()
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name, **args):
+        """Context manager that records the time spent inside it as a span on the current thread."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def traced(self, name):
+        """Decorator that records every call of a function as a span."""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, name, None):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _record(self, name, start_ns, end_ns, args):
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        event = {
+            'name': name,
+            'ph': 'X',
+            'ts': (start_ns - self._origin) / 1000,
+            'dur': (end_ns - start_ns) / 1000,
+            'pid': os.getpid(),
+            'tid': tid,
+        }
+        if args:
+            event['args'] = args
+        self._events.append(event)
+
+    def dump(self, path):
+        """Writes the recorded spans to path in Chrome trace format. Returns the number of spans."""
+        pid = os.getpid()
+        events = list(self._events)
+        metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                    for tid, name in list(self._thread_names.items())]
+        with atomic_write(path) as trace_file:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, trace_file)
+        print(f"Wrote {len(events)} trace spans to '{path}'.")
+        return len(events)
+
+# Shared tracer used by all modules
+tracer = Tracer()
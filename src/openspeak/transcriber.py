@@ -5,16 +5,81 @@ import os
 import subprocess
 import sys
 import importlib
+import importlib.util
+import threading
+import time
+
+import numpy as np
+
+from .metrics import metrics
+from .tracing import tracer
+from .model_cache import ModelCacheIndex
+from .model_pool import ModelPool
+
+# Compute type used when none is configured or tuned
+DEFAULT_COMPUTE_TYPES = {'cuda': 'float16', 'cpu': 'int8'}
+
+# Memory per weight relative to the float16 files models are downloaded as
+COMPUTE_TYPE_SCALE = {'int8': 0.5, 'int8_float32': 0.5, 'int8_float16': 0.5, 'int8_bfloat16': 0.5,
+                      'float16': 1.0, 'bfloat16': 1.0, 'float32': 2.0}
+
+# Named decoding parameter sets, from fastest to most accurate. "accurate"
+# is faster-whisper's default behaviour with beam search.
+DECODING_PROFILES = {
+    'fast': {
+        'beam_size': 1,
+        'best_of': 1,
+        'temperature': 0.0,
+        'without_timestamps': True,
+        'condition_on_previous_text': False,
+    },
+    'balanced': {
+        'beam_size': 2,
+        'best_of': 2,
+        'temperature': (0.0, 0.4, 0.8),
+        'without_timestamps': True,
+        'condition_on_previous_text': False,
+    },
+    'accurate': {
+        'beam_size': 5,
+    },
+}
+# Same decoding as before profiles existed, so upgrading doesn't change accuracy
+DEFAULT_DECODING_PROFILE = 'accurate'
+
+# Optional packages the local engine needs. Torch is a dependency of
+# faster-whisper, but we check it explicitly.
+LOCAL_ENGINE_PACKAGES = ('faster_whisper', 'torch')
+
+_capabilities = None
+
+def probe_capabilities():
+    """Checks which optional packages are installed without importing them."""
+    capabilities = {}
+    for name in LOCAL_ENGINE_PACKAGES:
+        try:
+            capabilities[name] = importlib.util.find_spec(name) is not None
+        except (ImportError, ValueError):
+            capabilities[name] = False
+    return capabilities
+
+def get_capabilities():
+    """Returns the cached capability registry, probing it on first use."""
+    global _capabilities
+    if _capabilities is None:
+        _capabilities = probe_capabilities()
+    return _capabilities
+
+def refresh_capabilities():
+    """Re-probes installed packages, e.g. after installing dependencies."""
+    global _capabilities
+    importlib.invalidate_caches()
+    _capabilities = probe_capabilities()
+    return _capabilities
 
 def are_dependencies_installed():
     """Check if faster-whisper and torch are installed."""
-    try:
-        importlib.import_module('faster_whisper')
-        # Torch is a dependency of faster-whisper, but we can check explicitly
-        importlib.import_module('torch')
-        return True
-    except ImportError:
-        return False
+    return all(get_capabilities().get(name) for name in LOCAL_ENGINE_PACKAGES)
 
 def install_dependencies(progress_callback=None):
     """
@@ -64,10 +129,10 @@ def install_dependencies(progress_callback=None):
         process.wait()
         
         if process.returncode == 0:
+            # Re-probe so the new modules are found
+            refresh_capabilities()
             if progress_callback:
                 progress_callback("Dependencies installed successfully.")
-            # Invalidate caches to ensure the new module is found
-            importlib.invalidate_caches()
             return True
         else:
             if progress_callback:
@@ -85,34 +150,111 @@ class WhisperTranscriber:
         self.model_size = None
         self.device = None
         self.compute_type = None
+        self.cpu_threads = 0  # 0 lets CTranslate2 choose
+        self.num_workers = 1  # Number of transcriptions the model can run in parallel
+        # Every decode holds a slot, so pipeline workers and streaming
+        # segments together never exceed num_workers concurrent decodes
+        self._decode_slots = threading.Semaphore(1)
         self.model = None
+        # Clips at least this long are decoded in batches of 30 s windows (0 disables)
+        self.batch_threshold_seconds = 0.0
+        self.batch_size = 8
+        self.decoding_profile = DEFAULT_DECODING_PROFILE
+        self._batched = None  # BatchedInferencePipeline wrapping self.model
         self.cache_path = os.path.join(os.path.expanduser("~"), ".whisper_model_cache")
+        self.model_index = ModelCacheIndex(self.cache_path)
+        # Recently used models stay loaded, keyed by _model_config()
+        self.model_pool = ModelPool()
+        self.warmup_enabled = False
+        self.warmup_seconds = None  # Duration of the last warm-up pass
 
-    def set_config(self, model_size, device):
+    def set_config(self, model_size, device, compute_type=None, cpu_threads=0, num_workers=1):
         """Sets the configuration for the transcriber and unloads the current model if the config changes."""
-        new_compute_type = "float16" if device == "cuda" else "int8"
-        
-        if model_size != self.model_size or device != self.device:
-            print(f"Configuration changed. New settings - Model: {model_size}, Device: {device}")
+        new_compute_type = compute_type or DEFAULT_COMPUTE_TYPES.get(device, "int8")
+        new_config = (model_size, device, new_compute_type, cpu_threads, num_workers)
+
+        if new_config != self._model_config():
+            print(f"Configuration changed. New settings - Model: {model_size}, Device: {device}, "
+                  f"Compute type: {new_compute_type}, CPU threads: {cpu_threads or 'default'}")
             self.model_size = model_size
             self.device = device
             self.compute_type = new_compute_type
-            if self.model:
-                print("Unloading old model from memory.")
-                del self.model
-                self.model = None
+            self.cpu_threads = cpu_threads
+            if num_workers != self.num_workers:
+                # Decodes already running release the semaphore they acquired
+                self._decode_slots = threading.Semaphore(max(1, num_workers))
+            self.num_workers = num_workers
+            # The old model stays in the pool; reuse the new one if it is still there
+            self.model = self.model_pool.get(new_config) if model_size else None
+            self._batched = None  # Would keep the old model alive after the pool drops it
+            if self.model is not None:
+                print(f"Using model '{model_size}' already loaded in memory.")
+
+    def _model_config(self):
+        return (self.model_size, self.device, self.compute_type, self.cpu_threads, self.num_workers)
+
+    def _create_model(self, model_size, **kwargs):
+        from faster_whisper import WhisperModel
+        return WhisperModel(
+            model_size,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=self.num_workers,
+            download_root=self.cache_path,
+            **kwargs
+        )
+
+    def _pool_model(self, config, model):
+        """Adds a freshly loaded model to the pool, with an estimate of its memory use."""
+        model_size, _, compute_type = config[:3]
+        size = self.model_index.model_file_size(model_size)
+        if size is not None:
+            size = int(size * COMPUTE_TYPE_SCALE.get(compute_type, 1.0))
+        self.model_pool.put(config, model, size)
+
+    def unload_model(self):
+        """Frees the loaded model and every other pooled model. initialize_model() loads it again."""
+        if self.model is not None:
+            print(f"Unloading model '{self.model_size}' from memory.")
+        self.model = None
+        self._batched = None
+        self.model_pool.clear()
+
+    def set_decoding_profile(self, profile):
+        if profile not in DECODING_PROFILES:
+            print(f"Unknown decoding profile '{profile}'. Using '{DEFAULT_DECODING_PROFILE}'.")
+            profile = DEFAULT_DECODING_PROFILE
+        self.decoding_profile = profile
+
+    def _batched_pipeline(self):
+        """Returns a batched pipeline for the loaded model, or None if faster-whisper has none."""
+        if self._batched is None or self._batched.model is not self.model:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                print("This faster-whisper version has no batched inference. Decoding sequentially.")
+                self.batch_threshold_seconds = 0.0
+                return None
+            self._batched = BatchedInferencePipeline(model=self.model)
+        return self._batched
+
+    def _start_transcription(self, audio_data):
+        """Starts decoding a clip, batched if it is long enough. Returns (segments, info)."""
+        options = DECODING_PROFILES[self.decoding_profile]
+        duration = audio_data.size / 16000
+        if self.batch_threshold_seconds and duration >= self.batch_threshold_seconds:
+            batched = self._batched_pipeline()
+            if batched is not None:
+                print(f"Decoding {duration:.0f}s clip in batches of {self.batch_size}.")
+                return batched.transcribe(audio_data, batch_size=self.batch_size, **options)
+        return self.model.transcribe(audio_data, **options)
 
     def is_model_downloaded(self, model_size):
-        """Checks if a model is available locally by trying to load it without network access."""
+        """Checks if a model is fully present in the local cache, using file metadata only."""
         if not are_dependencies_installed():
             return False
-        
-        from faster_whisper import WhisperModel
-        try:
-            WhisperModel(model_size, download_root=self.cache_path, local_files_only=True)
-            return True
-        except Exception:
-            return False
+        return self.model_index.is_present(model_size)
 
     def download_model(self, model_size):
         """Downloads and initializes a model, making it the active model."""
@@ -124,24 +266,21 @@ class WhisperTranscriber:
             print("Cannot download model, device not configured.")
             return False
 
-        from faster_whisper import WhisperModel
         print(f"Downloading model '{model_size}' for device '{self.device}'... This may take a while.")
         try:
-            new_model = WhisperModel(
-                model_size,
-                device=self.device,
-                compute_type=self.compute_type,
-                download_root=self.cache_path
-            )
+            new_model = self._create_model(model_size)
+            self._warm_up(new_model)
             print(f"Model '{model_size}' downloaded successfully and is now active.")
-            if self.model:
-                del self.model
             self.model = new_model
+            self._batched = None
             self.model_size = model_size # Ensure the current size is updated
+            self._pool_model(self._model_config(), new_model)
             return True
         except Exception as e:
             print(f"Failed to download or initialize model '{model_size}': {e}")
             return False
+        finally:
+            self.model_index.invalidate(model_size)
 
     def initialize_model(self):
         """Loads the configured model into memory if it's not already loaded."""
@@ -149,45 +288,106 @@ class WhisperTranscriber:
             print("Cannot initialize model, dependencies are not installed.")
             return
 
-        from faster_whisper import WhisperModel
         if self.model is None and self.model_size and self.device:
             print("Model not loaded. Attempting to initialize...")
             if self.is_model_downloaded(self.model_size):
+                requested = self._model_config()
                 print(f"Loading model '{self.model_size}' for device '{self.device}'...")
+                start = time.perf_counter()
                 try:
-                    self.model = WhisperModel(
-                        self.model_size,
-                        device=self.device,
-                        compute_type=self.compute_type,
-                        download_root=self.cache_path,
-                        local_files_only=True
-                    )
-                    print("Model initialized successfully.")
+                    model = self._create_model(self.model_size, local_files_only=True)
                 except Exception as e:
                     print(f"Failed to initialize model: {e}")
                     self.model = None
+                    return
+                metrics.observe('model_load_seconds', time.perf_counter() - start)
+                # set_config may have been called from another thread while loading
+                if requested != self._model_config():
+                    print("Configuration changed while loading. Keeping the loaded model in the pool.")
+                    self._pool_model(requested, model)
+                    return
+                self._warm_up(model)
+                self.model = model
+                self._batched = None
+                self._pool_model(requested, model)
+                print("Model initialized successfully.")
             else:
                 print(f"Model '{self.model_size}' is not downloaded. Please download it via the settings panel.")
 
-    def transcribe_audio(self, audio_data):
-        if not are_dependencies_installed():
-            return "Error: Local transcription libraries are not installed."
+    def _warm_up(self, model, duration=1.0, samplerate=16000):
+        """
+        Runs a short synthetic clip through a freshly loaded model so one-time
+        setup costs are paid here instead of on the user's first dictation.
+        """
+        if not self.warmup_enabled:
+            return
+        t = np.arange(int(duration * samplerate), dtype=np.float32) / samplerate
+        clip = (0.1 * np.sin(2 * np.pi * 220.0 * t)).astype(np.float32)
+        start = time.perf_counter()
+        try:
+            segments, _ = model.transcribe(clip, **DECODING_PROFILES[self.decoding_profile])
+            for _ in segments:  # Segments are decoded lazily
+                pass
+        except Exception as e:
+            print(f"Model warm-up failed: {e}")
+            return
+        self.warmup_seconds = time.perf_counter() - start
+        metrics.observe('model_warmup_seconds', self.warmup_seconds)
+        print(f"Model warm-up completed in {self.warmup_seconds:.2f}s.")
 
-        from faster_whisper import WhisperModel
+    def iter_transcription(self, audio_data):
+        """
+        Yields the text of each segment as soon as faster-whisper decodes it,
+        so callers can use the start of a long clip before the end is decoded.
+        """
+        # A loaded model implies the dependencies are installed, so the hot
+        # path does not need to probe for them.
         if self.model is None:
+            if not are_dependencies_installed():
+                yield "Error: Local transcription libraries are not installed."
+                return
             print("Transcriber not initialized. Cannot transcribe.")
-            return "Error: Model not loaded. Please configure it in the settings."
+            yield "Error: Model not loaded. Please configure it in the settings."
+            return
 
         if audio_data.size == 0:
             print("No audio data to transcribe.")
-            return ""
+            return
         print("Transcribing audio...")
+        # Decode time excludes whatever the caller does between segments and
+        # any wait for a decode slot. A slot is held only while decoding, so
+        # other decodes can run while the caller uses a segment.
+        decode_seconds = 0.0
+        decode_slots = self._decode_slots
         try:
-            segments, info = self.model.transcribe(audio_data, beam_size=5)
+            with decode_slots:
+                start = time.perf_counter()
+                # segments is a lazy generator: each one is decoded as we iterate
+                with tracer.span('whisper setup', audio_seconds=audio_data.size / 16000):
+                    segments, info = self._start_transcription(audio_data)
+                decode_seconds += time.perf_counter() - start
             print(f"Detected language '{info.language}' with probability {info.language_probability}")
-            transcribed_text = "".join(segment.text for segment in segments)
-            print(f"Transcription complete: {transcribed_text}")
-            return transcribed_text.strip()
+            segments = iter(segments)
+            while True:
+                with decode_slots:
+                    start = time.perf_counter()
+                    with tracer.span('whisper segment'):
+                        segment = next(segments, None)
+                    decode_seconds += time.perf_counter() - start
+                if segment is None:
+                    break
+                text = segment.text.strip()
+                if text:
+                    yield text
         except Exception as e:
             print(f"An error occurred during transcription: {e}")
-            return "" 
\ No newline at end of file
+            metrics.increment('local_decode_errors_total')
+            return
+        metrics.observe('decode_seconds', decode_seconds)
+        metrics.observe('decode_rtf', decode_seconds / (audio_data.size / 16000))
+
+    def transcribe_audio(self, audio_data):
+        transcribed_text = " ".join(self.iter_transcription(audio_data))
+        if transcribed_text:
+            print(f"Transcription complete: {transcribed_text}")
+        return transcribed_text
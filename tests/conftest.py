@@ -0,0 +1,9 @@
+import os
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# The package lives in src/ and is not installed, like in main.py
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+# The stand-in OpenAI server and clip helpers are shared with the benchmarks
+sys.path.insert(0, os.path.join(REPO_ROOT, 'benchmarks'))
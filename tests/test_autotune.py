@@ -0,0 +1,66 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from openspeak import autotune
+from openspeak.autotune import TuningInterrupted, time_transcription
+
+CLIP = np.zeros(1600, dtype=np.float32)
+
+class FakeModel:
+    """Transcribes instantly; on_run is called for every transcription."""
+
+    def __init__(self, *args, on_run=None, **kwargs):
+        self.kwargs = kwargs
+        self.on_run = on_run or (lambda: None)
+
+    def transcribe(self, clip, **options):
+        self.on_run()
+        return iter(()), None
+
+@pytest.fixture
+def fake_whisper(monkeypatch):
+    """Installs a stand-in faster_whisper whose models call the returned hook on every run."""
+    hook = types.SimpleNamespace(on_run=lambda: None)
+    module = types.ModuleType('faster_whisper')
+    module.WhisperModel = lambda *args, **kwargs: FakeModel(*args, on_run=lambda: hook.on_run(), **kwargs)
+    monkeypatch.setitem(sys.modules, 'faster_whisper', module)
+    return hook
+
+def test_interrupted_timing_is_discarded():
+    activity = [0]
+    model = FakeModel(on_run=lambda: activity.__setitem__(0, activity[0] + 1))
+    assert time_transcription(model, CLIP, interrupted=lambda: activity[0] > 1) is None
+    assert time_transcription(model, CLIP, interrupted=lambda: False) is not None
+
+def test_overlapping_dictation_retimes_the_candidate(fake_whisper, monkeypatch):
+    monkeypatch.setattr(autotune, 'COMPUTE_TYPE_CANDIDATES', {'cpu': ('int8',)})
+    monkeypatch.setattr(autotune, 'thread_candidates', lambda device: (0,))
+    recordings = [0]
+    runs = [0]
+
+    def on_run():
+        runs[0] += 1
+        if runs[0] == 2:
+            recordings[0] += 1  # A dictation starts during the second run
+    fake_whisper.on_run = on_run
+
+    waits = []
+    best, results = autotune.autotune('tiny', 'cpu', None, clip=CLIP, runs=2,
+                                      wait_until_idle=lambda: waits.append(1),
+                                      activity_count=lambda: recordings[0])
+    assert best == ('int8', 0)
+    # Two runs discarded, then warm-up plus two timed runs
+    assert runs[0] == 5
+    assert len(waits) == 3  # Before loading, and before each of the two timing attempts
+
+def test_constant_dictation_stops_tuning(fake_whisper, monkeypatch):
+    monkeypatch.setattr(autotune, 'COMPUTE_TYPE_CANDIDATES', {'cpu': ('int8',)})
+    monkeypatch.setattr(autotune, 'thread_candidates', lambda device: (0,))
+    recordings = [0]
+    fake_whisper.on_run = lambda: recordings.__setitem__(0, recordings[0] + 1)
+
+    with pytest.raises(TuningInterrupted):
+        autotune.autotune('tiny', 'cpu', None, clip=CLIP, activity_count=lambda: recordings[0])
@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from cloud_chunking import tone_clip, dominant_tone
+from fake_openai_server import FakeOpenAIServer
+from openspeak.cloud_transcriber import CloudTranscriber
+
+SEGMENTS = 8
+
+@pytest.fixture(scope='module')
+def server():
+    # Latency grows with clip length, like the real service
+    with FakeOpenAIServer(base_latency=0.05, seconds_per_audio_second=0.02, transcribe=dominant_tone) as server:
+        yield server
+
+def transcribe(server, max_parallel_requests):
+    transcriber = CloudTranscriber('test-key', base_url=server.base_url, chunk_seconds=10.0,
+                                   max_parallel_requests=max_parallel_requests)
+    server.requests.clear()
+    server.max_concurrent = 0
+    start = time.perf_counter()
+    text = transcriber.transcribe_audio(tone_clip(SEGMENTS))
+    return text, time.perf_counter() - start
+
+@pytest.mark.parametrize('max_parallel_requests', [2, 4])
+def test_chunks_are_stitched_in_order(server, max_parallel_requests):
+    text, _ = transcribe(server, max_parallel_requests)
+    assert text == " ".join(f"t{200 + 50 * n}" for n in range(SEGMENTS))
+    assert len(server.requests) == SEGMENTS
+
+@pytest.mark.parametrize('max_parallel_requests', [2, 4])
+def test_concurrency_is_bounded(server, max_parallel_requests):
+    transcribe(server, max_parallel_requests)
+    assert 1 < server.max_concurrent <= max_parallel_requests
+
+def test_parallel_chunks_are_faster(server):
+    _, sequential = transcribe(server, 1)
+    assert len(server.requests) == 1
+    _, parallel = transcribe(server, 4)
+    assert sequential / parallel > 1.5
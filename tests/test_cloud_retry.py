@@ -0,0 +1,77 @@
+import numpy as np
+import openai
+import pytest
+
+from openspeak.cloud_transcriber import CircuitBreaker, CloudTranscriber, CloudTranscriptionError
+
+CLIP = np.zeros(16000, dtype=np.float32)
+
+def connection_error():
+    return openai.APIConnectionError(request=None)
+
+def make_transcriber(outcomes, **kwargs):
+    """A transcriber whose requests raise or return the given outcomes in turn."""
+    transcriber = CloudTranscriber('test-key', chunk_seconds=0, retry_backoff=0, **kwargs)
+    transcriber.calls = 0
+
+    def request(audio_data, samplerate):
+        outcome = outcomes[min(transcriber.calls, len(outcomes) - 1)]
+        transcriber.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    transcriber._request = request
+    return transcriber
+
+def test_transient_errors_are_retried():
+    transcriber = make_transcriber([connection_error(), connection_error(), 'hello'], max_retries=2)
+    assert transcriber.transcribe_audio(CLIP) == 'hello'
+    assert transcriber.calls == 3
+
+def test_retries_give_up_after_max_retries():
+    transcriber = make_transcriber([connection_error()], max_retries=2)
+    with pytest.raises(CloudTranscriptionError):
+        transcriber.transcribe_audio(CLIP)
+    assert transcriber.calls == 3
+
+def test_other_errors_are_not_retried():
+    transcriber = make_transcriber([ValueError('bad audio')], max_retries=2)
+    with pytest.raises(CloudTranscriptionError):
+        transcriber.transcribe_audio(CLIP)
+    assert transcriber.calls == 1
+
+def test_circuit_opens_after_repeated_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    transcriber = make_transcriber([ValueError('down')], circuit_breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(CloudTranscriptionError):
+            transcriber.transcribe_audio(CLIP)
+    assert breaker.is_open()
+
+    # Rejected without calling the service
+    with pytest.raises(CloudTranscriptionError):
+        transcriber.transcribe_audio(CLIP)
+    assert transcriber.calls == 2
+
+def test_trial_request_closes_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    transcriber = make_transcriber([ValueError('down'), 'back'], circuit_breaker=breaker)
+    with pytest.raises(CloudTranscriptionError):
+        transcriber.transcribe_audio(CLIP)
+    assert breaker.is_open()
+
+    assert transcriber.transcribe_audio(CLIP) == 'back'
+    assert not breaker.is_open()
+
+def test_half_open_circuit_lets_one_trial_through(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('openspeak.cloud_transcriber.time.monotonic', lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    now[0] += 60
+    assert breaker.allow_request()
+    # Further requests wait until the trial has succeeded or another period has passed
+    assert not breaker.allow_request()
@@ -0,0 +1,29 @@
+import pytest
+
+from clips import speech_like_clip
+from cloud_upload import time_to_first_byte
+from fake_openai_server import FakeOpenAIServer
+from openspeak.cloud_transcriber import CloudTranscriber, encode_audio
+
+@pytest.mark.parametrize('upload_format', ['flac', 'wav16'])
+def test_compact_formats_are_smaller_than_wav(upload_format):
+    clip = speech_like_clip(5)
+    _, wav = encode_audio(clip, upload_format='wav')
+    _, compact = encode_audio(clip, upload_format=upload_format)
+    assert len(compact) < len(wav) * 0.6
+
+def test_uploaded_payload_uses_the_configured_format():
+    clip = speech_like_clip(5)
+    with FakeOpenAIServer() as server:
+        for upload_format in ('wav', 'wav16', 'flac'):
+            CloudTranscriber('test-key', upload_format=upload_format, base_url=server.base_url).transcribe_audio(clip)
+    wav, wav16, flac = (size for size, _ in server.requests)
+    assert flac < wav16 < wav
+
+def test_smaller_uploads_reach_the_first_byte_sooner():
+    clip = speech_like_clip(5)
+    # 2 Mbit/s uplink: the float WAV takes about 1.3 s to send
+    with FakeOpenAIServer(upload_bytes_per_second=250000) as server:
+        wav = time_to_first_byte(server.base_url, encode_audio(clip, upload_format='wav'))
+        flac = time_to_first_byte(server.base_url, encode_audio(clip, upload_format='flac'))
+    assert flac < wav * 0.6
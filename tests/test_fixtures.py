@@ -0,0 +1,10 @@
+import os
+
+from decoding_profiles import load_fixtures, normalize
+
+def test_bundled_speech_fixtures_load():
+    fixtures = load_fixtures(os.path.join(os.path.dirname(__file__), '..', 'benchmarks', 'fixtures'))
+    assert len(fixtures) >= 5
+    for name, clip, reference in fixtures:
+        assert clip.size > 0, name
+        assert normalize(reference), name
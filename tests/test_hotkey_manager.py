@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import keyboard
+import pytest
+
+from openspeak.hotkey_manager import HotkeyManager
+
+# Windows scan codes. Aliases ('win', 'control') and sides are resolved by the
+# keyboard library itself; only the OS lookup is replaced.
+SCAN_CODES = {
+    'left ctrl': 29, 'right ctrl': 3613,
+    'left shift': 42, 'right shift': 54,
+    'left windows': 91, 'right windows': 92,
+    'space': 57, 'a': 30,
+}
+
+@pytest.fixture(autouse=True)
+def fake_key_table(monkeypatch):
+    def map_name(name):
+        if name not in SCAN_CODES:
+            raise ValueError(name)
+        yield SCAN_CODES[name], ()
+    monkeypatch.setattr(keyboard._os_keyboard, 'map_name', map_name)
+
+def down(name):
+    return SimpleNamespace(name=name, scan_code=SCAN_CODES[name], event_type=keyboard.KEY_DOWN)
+
+def up(name):
+    return SimpleNamespace(name=name, scan_code=SCAN_CODES[name], event_type=keyboard.KEY_UP)
+
+def make_manager(hotkey, mode='hold'):
+    calls = []
+    manager = HotkeyManager(lambda: calls.append('press'), lambda: calls.append('release'))
+    manager.set_config(hotkey, mode)
+    return manager, calls
+
+def feed(manager, *events):
+    for event in events:
+        manager._key_event_handler(event)
+
+def test_hold_presses_and_releases():
+    manager, calls = make_manager('ctrl+space')
+    feed(manager, down('left ctrl'), down('space'))
+    assert calls == ['press']
+    feed(manager, up('space'), up('left ctrl'))
+    assert calls == ['press', 'release']
+
+def test_primary_key_alone_does_nothing():
+    manager, calls = make_manager('ctrl+space')
+    feed(manager, down('space'), up('space'), down('a'), up('a'))
+    assert calls == []
+
+def test_auto_repeat_is_ignored():
+    manager, calls = make_manager('ctrl+space', 'toggle')
+    feed(manager, down('left ctrl'), down('space'), down('space'), down('space'), up('space'))
+    assert calls == ['press']
+    feed(manager, down('space'), up('space'))
+    assert calls == ['press', 'release']
+
+def test_toggle_flips_on_each_press():
+    manager, calls = make_manager('right shift', 'toggle')
+    for _ in range(2):
+        feed(manager, down('right shift'), up('right shift'))
+    assert calls == ['press', 'release']
+
+@pytest.mark.parametrize('hotkey', ['ctrl+win+space', 'control+windows+space'])
+def test_aliases_match_either_side(hotkey):
+    manager, calls = make_manager(hotkey)
+    feed(manager, down('left ctrl'), down('left windows'), down('space'), up('space'))
+    feed(manager, down('right ctrl'), down('right windows'), down('space'), up('space'))
+    assert calls == ['press', 'release', 'press', 'release']
+
+def test_sided_key_matches_only_its_side():
+    manager, calls = make_manager('right shift')
+    feed(manager, down('left shift'), up('left shift'))
+    assert calls == []
+    feed(manager, down('right shift'))
+    assert calls == ['press']
+
+def test_modifier_released_before_press_does_not_fire():
+    manager, calls = make_manager('ctrl+space')
+    feed(manager, down('left ctrl'), up('left ctrl'), down('space'))
+    assert calls == []
+
+def test_hotkey_held_tracks_any_hotkey_key():
+    manager, _ = make_manager('ctrl+space')
+    feed(manager, down('a'))
+    assert not manager.hotkey_held()
+    feed(manager, down('right ctrl'))
+    assert manager.hotkey_held()
+    feed(manager, up('right ctrl'))
+    assert not manager.hotkey_held()
+
+def test_unknown_key_never_fires():
+    manager, calls = make_manager('ctrl+nosuchkey')
+    feed(manager, down('left ctrl'), down('space'))
+    assert calls == []
@@ -0,0 +1,36 @@
+import json
+
+from openspeak.metrics import Histogram, MetricsFileWriter, MetricsRegistry
+
+def test_histogram_quantiles():
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.observe(float(value))
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 100
+    assert snapshot['mean'] == 50.5
+    assert (snapshot['min'], snapshot['max']) == (1.0, 100.0)
+    assert (snapshot['p50'], snapshot['p90'], snapshot['p99']) == (51.0, 91.0, 100.0)
+
+def test_histogram_quantiles_cover_only_recent_samples():
+    histogram = Histogram(window=10)
+    for value in range(100):
+        histogram.observe(float(value))
+    snapshot = histogram.snapshot()
+    assert snapshot['p50'] == 95.0
+    assert snapshot['min'] == 0.0  # min, max and count still cover every sample
+
+def test_empty_histogram():
+    assert Histogram().snapshot()['p50'] is None
+
+def test_file_writer_writes_snapshot(tmp_path):
+    registry = MetricsRegistry()
+    registry.increment('recordings_total', 2)
+    registry.observe('decode_seconds', 0.5)
+    path = tmp_path / 'metrics.json'
+    MetricsFileWriter(registry, str(path)).write()
+
+    snapshot = json.loads(path.read_text())
+    assert snapshot['counters'] == {'recordings_total': 2}
+    assert snapshot['histograms']['decode_seconds']['count'] == 1
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from openspeak import model_cache
+from openspeak.model_cache import ModelCacheIndex, repo_id_for
+
+def make_snapshot(cache_path, repo_id, revision='abc123'):
+    repo_dir = os.path.join(cache_path, 'models--' + repo_id.replace('/', '--'))
+    snapshot = os.path.join(repo_dir, 'snapshots', revision)
+    os.makedirs(snapshot)
+    os.makedirs(os.path.join(repo_dir, 'refs'))
+    with open(os.path.join(repo_dir, 'refs', 'main'), 'w') as ref_file:
+        ref_file.write(revision)
+    for name in ('model.bin', 'config.json', 'tokenizer.json', 'vocabulary.txt'):
+        with open(os.path.join(snapshot, name), 'w') as model_file:
+            model_file.write('x')
+    return snapshot
+
+@pytest.mark.parametrize('model_size, repo_id', [
+    ('tiny.en', 'Systran/faster-whisper-tiny.en'),
+    ('large', 'Systran/faster-whisper-large-v3'),
+    ('distil-small.en', 'Systran/faster-distil-whisper-small.en'),
+    ('turbo', 'mobiuslabsgmbh/faster-whisper-large-v3-turbo'),
+    ('someone/custom-model', 'someone/custom-model'),
+])
+def test_model_names_map_to_faster_whisper_repos(tmp_path, model_size, repo_id):
+    assert repo_id_for(model_size) == repo_id
+    make_snapshot(str(tmp_path), repo_id)
+    index = ModelCacheIndex(str(tmp_path))
+    assert index.is_present(model_size)
+    assert index.model_file_size(model_size) == 1
+
+def test_missing_model_is_not_present(tmp_path):
+    assert not ModelCacheIndex(str(tmp_path)).is_present('small.en')
+
+def test_unknown_names_fall_back_to_faster_whisper(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(model_cache, 'probe_with_faster_whisper',
+                        lambda model_size, cache_path: calls.append(model_size) or True)
+    assert ModelCacheIndex(str(tmp_path)).is_present('large-v4')
+    assert calls == ['large-v4']
@@ -0,0 +1,61 @@
+from openspeak import model_pool
+from openspeak.model_pool import ModelPool
+from openspeak.transcriber import WhisperTranscriber
+
+MB = 1024 * 1024
+
+def config(name):
+    return (name, 'cpu', 'int8', 0, 1)
+
+def test_default_pool_keeps_only_the_active_model():
+    pool = ModelPool()
+    pool.put(config('a'), object())
+    pool.put(config('b'), object())
+    assert pool.keys() == [config('b')]
+
+def test_memory_budget_evicts_least_recently_used():
+    pool = ModelPool(capacity=3, max_memory_mb=250)
+    pool.put(config('a'), object(), 100 * MB)
+    pool.put(config('b'), object(), 100 * MB)
+    pool.get(config('a'))
+    pool.put(config('c'), object(), 100 * MB)
+    assert pool.keys() == [config('a'), config('c')]
+
+def test_model_over_budget_is_still_kept():
+    pool = ModelPool(capacity=2, max_memory_mb=10)
+    pool.put(config('a'), object(), 100 * MB)
+    assert pool.keys() == [config('a')]
+
+def test_auto_budget_is_a_share_of_memory(monkeypatch):
+    queried = []
+    monkeypatch.setattr(model_pool, 'total_memory_mb', lambda device: queried.append(device) or 1000)
+    pool = ModelPool()
+    pool.configure(3, 'auto', device='cuda')
+    assert queried == []  # Not looked up until a model is loaded
+
+    pool.put(config('a'), object(), 200 * MB)
+    assert queried == ['cuda'] and pool.max_memory_mb == 250
+    pool.put(config('b'), object(), 100 * MB)
+    assert pool.keys() == [config('b')]
+
+def test_unknown_memory_keeps_only_the_active_model(monkeypatch):
+    monkeypatch.setattr(model_pool, 'total_memory_mb', lambda device: None)
+    pool = ModelPool()
+    pool.configure(3, 'auto')
+    pool.put(config('a'), object(), MB)
+    pool.put(config('b'), object(), MB)
+    assert pool.keys() == [config('b')]
+
+def test_switching_models_drops_the_batched_pipeline():
+    transcriber = WhisperTranscriber()
+    transcriber.model_pool.configure(2)
+    transcriber.set_config('tiny.en', 'cpu')
+    transcriber.model = old = object()
+    transcriber._pool_model(transcriber._model_config(), old)
+    transcriber._batched = object()
+
+    transcriber.set_config('base.en', 'cpu')
+    assert transcriber._batched is None
+    transcriber.set_config('tiny.en', 'cpu')
+    assert transcriber.model is old
+    assert transcriber._batched is None
@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from openspeak.pipeline import TranscriptionPipeline
+
+class Recorder:
+    """Collects injected text and signals when the pipeline goes idle."""
+
+    def __init__(self):
+        self.injected = []
+        self.idle = threading.Event()
+
+    def inject(self, text):
+        self.injected.append(text)
+
+    def on_idle(self):
+        self.idle.set()
+
+    def wait_idle(self):
+        assert self.idle.wait(5), "pipeline did not finish"
+        self.idle.clear()
+
+def make_pipeline(num_workers=1, max_pending=8):
+    recorder = Recorder()
+    pipeline = TranscriptionPipeline(recorder.inject, on_idle=recorder.on_idle,
+                                     num_workers=num_workers, max_pending=max_pending)
+    return pipeline, recorder
+
+def test_results_are_injected_in_order_with_several_workers():
+    pipeline, recorder = make_pipeline(num_workers=4)
+    # Earlier jobs take longest, so they finish last
+    for n in range(8):
+        pipeline.submit(lambda n=n: time.sleep(0.01 * (8 - n)) or f"clip{n}")
+    recorder.wait_idle()
+    assert recorder.injected == [f"clip{n}" for n in range(8)]
+
+def test_pieces_stream_only_at_the_head():
+    pipeline, recorder = make_pipeline(num_workers=2)
+    first_started = threading.Event()
+    release_first = threading.Event()
+    second_done = threading.Event()
+
+    def first():
+        yield "a1"
+        first_started.set()
+        release_first.wait(5)
+        yield "a2"
+
+    def second():
+        yield "b1"
+        second_done.set()
+        yield "b2"
+
+    pipeline.submit(first)
+    pipeline.submit(second)
+    assert first_started.wait(5) and second_done.wait(5)
+    time.sleep(0.05)
+    # The head job's first piece is already typed; the second job waits its turn
+    assert recorder.injected == ["a1"]
+
+    release_first.set()
+    recorder.wait_idle()
+    assert recorder.injected == ["a1", "a2", "b1", "b2"]
+
+def test_jobs_beyond_max_pending_are_dropped():
+    pipeline, recorder = make_pipeline(max_pending=2)
+    release = threading.Event()
+    assert pipeline.submit(lambda: release.wait(5) and "one")
+    assert pipeline.submit(lambda: "two")
+    assert not pipeline.submit(lambda: "three")
+    assert pipeline.depth() == 2
+
+    release.set()
+    recorder.wait_idle()
+    assert recorder.injected == ["one", "two"]
+    assert pipeline.submit(lambda: "four")
+
+def test_failed_job_does_not_block_later_ones():
+    pipeline, recorder = make_pipeline()
+    pipeline.submit(lambda: 1 / 0)
+    pipeline.submit(lambda: "after")
+    recorder.wait_idle()
+    assert recorder.injected == ["after"]
+
+@pytest.mark.parametrize('grow, shrink', [(4, 1), (3, 2)])
+def test_set_workers_shrinks_the_pool(grow, shrink):
+    pipeline, recorder = make_pipeline(num_workers=grow)
+    assert len(pipeline._workers) == grow
+    pipeline.set_workers(shrink)
+    deadline = time.monotonic() + 5
+    while len(pipeline._workers) > shrink and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pipeline.num_workers == shrink
+    assert len(pipeline._workers) == shrink
+
+    pipeline.submit(lambda: "still works")
+    recorder.wait_idle()
+    assert recorder.injected == ["still works"]
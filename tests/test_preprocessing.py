@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from openspeak.preprocessing import find_quiet_cut, split_at_silence, trim_silence
+
+SAMPLERATE = 16000
+
+def tone(seconds, frequency=300):
+    t = np.arange(int(seconds * SAMPLERATE)) / SAMPLERATE
+    return (0.3 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+def silence(seconds):
+    return np.zeros(int(seconds * SAMPLERATE), dtype=np.float32)
+
+def test_trim_keeps_padding_around_speech():
+    clip = np.concatenate([silence(1), tone(2), silence(1)])
+    trimmed = trim_silence(clip, SAMPLERATE, padding_ms=200)
+    # 200 ms of padding on each side, rounded to whole 20 ms frames
+    assert trimmed.size == pytest.approx(2.4 * SAMPLERATE, abs=0.02 * SAMPLERATE)
+    start = (trimmed.ctypes.data - clip.ctypes.data) // clip.itemsize
+    assert start == pytest.approx(0.8 * SAMPLERATE, abs=0.02 * SAMPLERATE)
+
+def test_trim_padding_stops_at_the_clip_edges():
+    clip = np.concatenate([silence(0.05), tone(1)])
+    assert trim_silence(clip, SAMPLERATE, padding_ms=200).size == clip.size
+
+def test_all_silent_clip_trims_to_empty():
+    assert trim_silence(silence(2), SAMPLERATE).size == 0
+    assert trim_silence(silence(0), SAMPLERATE).size == 0
+
+def test_clip_shorter_than_min_speech_trims_to_empty():
+    clip = np.concatenate([silence(1), tone(0.06), silence(1)])
+    assert trim_silence(clip, SAMPLERATE, min_speech_ms=100).size == 0
+    assert trim_silence(clip, SAMPLERATE, min_speech_ms=40).size > 0
+
+def test_trimmed_clip_is_a_view():
+    clip = np.concatenate([silence(1), tone(1), silence(1)])
+    trimmed = trim_silence(clip, SAMPLERATE)
+    assert np.shares_memory(trimmed, clip)
+
+def test_quiet_cut_lands_in_the_pause():
+    window = np.concatenate([tone(8), silence(0.5), tone(1.5)])
+    cut = find_quiet_cut(window, SAMPLERATE)
+    assert 8 * SAMPLERATE < cut <= 8.5 * SAMPLERATE
+
+def test_quiet_cut_of_short_window_is_its_end():
+    # Shorter than a single 20 ms frame
+    assert find_quiet_cut(tone(0.01), SAMPLERATE) == int(0.01 * SAMPLERATE)
+    assert find_quiet_cut(silence(0), SAMPLERATE) == 0
+
+def test_quiet_cut_only_searches_the_second_half():
+    window = np.concatenate([silence(0.5), tone(1.5)])
+    assert find_quiet_cut(window, SAMPLERATE) >= window.size // 2
+
+def test_short_clip_is_not_split():
+    clip = tone(5)
+    chunks = split_at_silence(clip, SAMPLERATE, chunk_seconds=20)
+    assert len(chunks) == 1 and chunks[0].size == clip.size
+
+def test_empty_clip_has_no_chunks():
+    assert split_at_silence(silence(0), SAMPLERATE) == []
+
+def test_chunks_are_cut_at_pauses():
+    clip = np.concatenate([tone(9), silence(1)] * 4)
+    chunks = split_at_silence(clip, SAMPLERATE, chunk_seconds=10)
+    assert all(chunk.size <= 10 * SAMPLERATE for chunk in chunks)
+    # Every cut falls in the pause after a sentence
+    for cut in np.cumsum([chunk.size for chunk in chunks[:-1]]):
+        assert 9 * SAMPLERATE < cut % (10 * SAMPLERATE) or cut % (10 * SAMPLERATE) == 0
+
+def test_clip_without_pauses_is_still_split():
+    clip = tone(25)
+    chunks = split_at_silence(clip, SAMPLERATE, chunk_seconds=10)
+    assert all(chunk.size <= 10 * SAMPLERATE for chunk in chunks)
+    assert sum(chunk.size for chunk in chunks) == clip.size
+
+@pytest.mark.parametrize('chunk_seconds', [1e-6, 0.001, 0.03])
+def test_tiny_chunks_cover_the_clip(chunk_seconds):
+    clip = tone(0.1)
+    chunks = split_at_silence(clip, SAMPLERATE, chunk_seconds=chunk_seconds)
+    assert all(chunk.size > 0 for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), clip)
@@ -0,0 +1,74 @@
+import os
+import stat
+
+import pytest
+
+from openspeak.settings import Settings
+
+@pytest.fixture
+def settings(tmp_path):
+    return Settings(str(tmp_path / 'config.ini'))
+
+def count_saves(settings, monkeypatch):
+    saves = []
+    save = settings.save
+    monkeypatch.setattr(settings, 'save', lambda: saves.append(1) or save())
+    return saves
+
+def test_missing_file_is_created_with_defaults(settings):
+    assert os.path.exists(settings.file_name)
+    assert Settings(settings.file_name).get_general('hotkey') == 'ctrl+space'
+
+def test_batch_writes_once(settings, monkeypatch):
+    saves = count_saves(settings, monkeypatch)
+    with settings.batch():
+        settings.set('General', 'hotkey', 'f9')
+        settings.set('General', 'hotkey_mode', 'toggle')
+        with settings.batch():
+            settings.set('Local', 'model_size', 'base.en')
+        assert saves == []
+    assert saves == [1]
+    reloaded = Settings(settings.file_name)
+    assert reloaded.get_general('hotkey') == 'f9'
+    assert reloaded.get_local('model_size') == 'base.en'
+
+def test_unchanged_value_is_not_written(settings, monkeypatch):
+    saves = count_saves(settings, monkeypatch)
+    settings.set('General', 'hotkey', settings.get_general('hotkey'))
+    with settings.batch():
+        settings.set('General', 'device', 'cpu')
+    assert saves == []
+
+def test_unchanged_file_is_not_read_again(settings, monkeypatch):
+    reads = []
+    read = settings.config.read
+    monkeypatch.setattr(settings.config, 'read', lambda *args: reads.append(1) or read(*args))
+    settings.load()
+    assert reads == []
+
+    other = Settings(settings.file_name)
+    other.set('General', 'hotkey', 'f9')
+    settings.load()
+    assert reads == [1]
+    assert settings.get_general('hotkey') == 'f9'
+
+@pytest.mark.skipif(os.name == 'nt', reason="POSIX permissions")
+def test_save_keeps_permissions(settings):
+    os.chmod(settings.file_name, 0o640)
+    settings.set('General', 'hotkey', 'f9')
+    assert stat.S_IMODE(os.stat(settings.file_name).st_mode) == 0o640
+
+def test_failed_write_leaves_the_file_alone(settings, monkeypatch):
+    with open(settings.file_name) as config_file:
+        before = config_file.read()
+
+    def fail(config_file):
+        config_file.write('[General]\nhotkey = half-writ')
+        raise OSError("disk full")
+    monkeypatch.setattr(settings.config, 'write', fail)
+
+    with pytest.raises(OSError):
+        settings.set('General', 'hotkey', 'f9')
+    with open(settings.file_name) as config_file:
+        assert config_file.read() == before
+    assert os.listdir(os.path.dirname(settings.file_name)) == ['config.ini']
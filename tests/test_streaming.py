@@ -0,0 +1,48 @@
+import threading
+
+import numpy as np
+import pytest
+
+from openspeak.streaming import StreamingTranscriber
+
+SAMPLERATE = 16000
+
+def feed_clip(streamer, clip, block=512):
+    for start in range(0, clip.size, block):
+        streamer.feed(clip[start:start + block])
+
+def noise(seconds):
+    return np.random.default_rng(0).standard_normal(int(seconds * SAMPLERATE)).astype(np.float32)
+
+@pytest.mark.parametrize('chunk_seconds', [0, 0.001, 3])
+def test_every_sample_is_decoded_once(chunk_seconds):
+    segments = []
+    streamer = StreamingTranscriber(lambda seg: segments.append(seg.size) or 'x', chunk_seconds=chunk_seconds)
+    streamer.start()
+    clip = noise(7)
+    feed_clip(streamer, clip)
+    text = streamer.finish()
+
+    assert sum(segments) == clip.size
+    assert all(size > 0 for size in segments)
+    assert text == ' '.join('x' * len(segments))
+
+def test_cancel_stops_the_decoder_without_flushing():
+    release = threading.Event()
+    calls = []
+
+    def transcribe(segment):
+        calls.append(segment.size)
+        release.wait(5)
+        return 'x'
+
+    streamer = StreamingTranscriber(transcribe, chunk_seconds=2)
+    streamer.start()
+    thread = streamer._thread
+    feed_clip(streamer, noise(7))
+    streamer.cancel()
+    release.set()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert sum(calls) < noise(7).size
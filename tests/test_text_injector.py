@@ -0,0 +1,88 @@
+import sys
+import time
+import types
+
+import pytest
+
+from openspeak import text_injector
+from openspeak.text_injector import AutoInjector, ClipboardInjector, FakeInjector
+
+CF_UNICODETEXT = 13
+CF_BITMAP = 2
+CF_DIB = 8
+CF_HTML = 0xC0FE  # Registered formats are numbered from 0xC000
+
+class FakeClipboard(types.ModuleType):
+    """Stands in for pywin32's win32clipboard module, with a dict as the clipboard."""
+    CF_UNICODETEXT = CF_UNICODETEXT
+
+    def __init__(self, contents):
+        super().__init__('win32clipboard')
+        self.contents = dict(contents)
+        self.pasted = []
+
+    def OpenClipboard(self):
+        pass
+
+    def CloseClipboard(self):
+        pass
+
+    def EmptyClipboard(self):
+        self.contents.clear()
+
+    def EnumClipboardFormats(self, previous):
+        formats = list(self.contents)
+        index = formats.index(previous) + 1 if previous else 0
+        return formats[index] if index < len(formats) else 0
+
+    def GetClipboardDataHandle(self, clipboard_format):
+        return clipboard_format
+
+    def GetGlobalMemory(self, handle):
+        return self.contents[handle]
+
+    def SetClipboardData(self, clipboard_format, data):
+        self.contents[clipboard_format] = data
+
+@pytest.fixture
+def paste(monkeypatch):
+    def paste(contents, text):
+        clipboard = FakeClipboard(contents)
+        monkeypatch.setitem(sys.modules, 'win32clipboard', clipboard)
+        monkeypatch.setattr(text_injector.keyboard, 'send',
+                            lambda keys: clipboard.pasted.append(clipboard.contents.get(CF_UNICODETEXT)))
+        ClipboardInjector(restore_delay=0).send(text)
+        return clipboard
+    return paste
+
+def test_every_memory_format_is_restored(paste):
+    contents = {CF_UNICODETEXT: 'old\0'.encode('utf-16-le'), CF_DIB: b'image', CF_HTML: b'<b>old</b>'}
+    clipboard = paste({**contents, CF_BITMAP: 1234}, 'new')
+
+    assert clipboard.pasted == ['new']
+    # CF_BITMAP is a GDI handle; Windows synthesizes it again from CF_DIB
+    assert clipboard.contents == contents
+
+def test_empty_clipboard_stays_empty(paste):
+    clipboard = paste({}, 'new')
+
+    assert clipboard.pasted == ['new']
+    assert clipboard.contents == {}
+
+def test_inject_waits_for_the_hotkey_release():
+    injector = FakeInjector()
+    polls = []
+    # Held for the first two polls
+    injector.keys_held = lambda: polls.append(time.perf_counter()) or len(polls) < 3
+    injector.inject("text")
+    assert len(polls) == 3
+    assert injector.injected[0][0] >= polls[-1]
+
+def test_auto_injector_pastes_only_long_text(monkeypatch):
+    injector = AutoInjector(paste_threshold=10)
+    sent = []
+    monkeypatch.setattr(injector.typing, 'send', lambda text: sent.append(('type', text)))
+    monkeypatch.setattr(injector.clipboard, 'send', lambda text: sent.append(('paste', text)))
+    injector.send("short")
+    injector.send("a much longer text")
+    assert sent == [('type', "short"), ('paste', "a much longer text")]
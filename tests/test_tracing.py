@@ -0,0 +1,37 @@
+import json
+import threading
+
+from openspeak.tracing import Tracer
+
+def test_disabled_tracer_records_nothing(tmp_path):
+    tracer = Tracer()
+    with tracer.span('ignored'):
+        pass
+    assert tracer.dump(str(tmp_path / 'trace.json')) == 0
+
+def test_spans_round_trip_as_chrome_trace(tmp_path):
+    tracer = Tracer()
+    tracer.enable()
+
+    @tracer.traced('decorated')
+    def work():
+        with tracer.span('inner', seq=3):
+            pass
+
+    work()
+    thread = threading.Thread(target=work, name='worker')
+    thread.start()
+    thread.join()
+
+    path = tmp_path / 'trace.json'
+    assert tracer.dump(str(path)) == 4
+    events = json.loads(path.read_text())['traceEvents']
+    spans = [e for e in events if e['ph'] == 'X']
+    assert [e['name'] for e in spans] == ['inner', 'decorated'] * 2
+    assert spans[0]['args'] == {'seq': 3}
+    # The inner span lies within the decorated one
+    inner, outer = spans[:2]
+    assert outer['ts'] <= inner['ts'] and inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur']
+    thread_names = {e['args']['name'] for e in events if e['ph'] == 'M'}
+    assert 'worker' in thread_names
+    assert list(tmp_path.iterdir()) == [path]  # No temporary file left behind
@@ -0,0 +1,51 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from openspeak.transcriber import WhisperTranscriber
+
+class ConcurrencyTrackingModel:
+    """Decodes each segment slowly and records how many decodes overlapped."""
+
+    def __init__(self, segments=3, seconds_per_segment=0.02):
+        self.segments = segments
+        self.seconds_per_segment = seconds_per_segment
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _decode(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.seconds_per_segment)
+        with self._lock:
+            self.active -= 1
+
+    def transcribe(self, audio, **options):
+        def segments():
+            for n in range(self.segments):
+                self._decode()
+                yield SimpleNamespace(text=f" s{n}")
+        return segments(), SimpleNamespace(language='en', language_probability=1.0)
+
+def decode_concurrently(num_workers, clips=4):
+    transcriber = WhisperTranscriber()
+    transcriber.set_config('tiny.en', 'cpu', num_workers=num_workers)
+    transcriber.model = model = ConcurrencyTrackingModel()
+    clip = np.zeros(16000, dtype=np.float32)
+    # Like a pipeline worker and streaming segments decoding at the same time
+    threads = [threading.Thread(target=transcriber.transcribe_audio, args=(clip,)) for _ in range(clips)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return model.max_active
+
+def test_decodes_are_serialized_with_one_worker():
+    assert decode_concurrently(num_workers=1) == 1
+
+def test_decodes_overlap_up_to_num_workers():
+    assert 1 < decode_concurrently(num_workers=2) <= 2